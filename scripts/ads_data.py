@@ -3,16 +3,35 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
+import threading
 import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Iterable
-
-ADS_API_URL = "https://api.adsabs.harvard.edu/v1/search/query"
+from typing import Iterable, Iterator
+
+from http_client import CLIENT
+from inspire_cache import InspireCache, arxiv_key, doi_key
+from near_duplicates import near_duplicate_groups
+from outputs import write_json_if_changed
+from paper_identity import IdentityIndex, identity_aliases, paper_aliases
+
+# Base URLs can be pointed at scripts/fake_services.py for offline runs.
+ADS_API_BASE_URL = os.environ.get("ADS_API_BASE_URL", "https://api.adsabs.harvard.edu/v1").rstrip("/")
+INSPIRE_API_BASE_URL = os.environ.get("INSPIRE_API_BASE_URL", "https://inspirehep.net/api").rstrip("/")
+ADS_API_URL = f"{ADS_API_BASE_URL}/search/query"
+ADS_BIGQUERY_URL = f"{ADS_API_BASE_URL}/search/bigquery"
+INSPIRE_API_URL = f"{INSPIRE_API_BASE_URL}/literature"
+DEFAULT_INSPIRE_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 4
+INSPIRE_BATCH_SIZE = 25
+WATERMARK_FIELDS = ("entry_date", "indexstamp")
+DEFAULT_WATERMARK_FIELD = "indexstamp"
 BLOCKED_PUB_PATTERNS = [
     r"aps meeting abstracts",
     r"bulletin of the american physical society",
@@ -22,6 +41,15 @@ EXCLUDED_BIBCODES = {
     "2012IJCA...38h..22V",
 }
 
+OWN_LAST_NAME = "venumadhav"
+OWN_FIRST_NAME_PREFIX = "tejaswi"
+NTH_AUTHOR_THRESHOLD = 12
+ARXIV_VENUE = "arXiv e-prints"
+# Papers with more authors store only the first COMPACT_AUTHORS_KEPT names in the
+# main JSON; full lists go to the authors sidecar (see write_papers_json).
+COMPACT_AUTHORS_ABOVE = 100
+COMPACT_AUTHORS_KEPT = 10
+
 ENRICHMENT_FIELDS = {
     "abstract",
     "topics",
@@ -48,10 +76,66 @@ class AdsPaper:
     inspire_recid: str | None
     citation_count: int
     abstract: str | None = None
+    # Key of the abstract in the abstract store; ``abstract`` stays None until load_abstract().
+    abstract_hash: str | None = None
     topics: list[str] = field(default_factory=list)
     topic_source: str | None = None
     topic_confidence: float | None = None
     topics_classified_with: str | None = None
+    paper_id: str | None = None
+    # Derived once per paper (see derive_fields) so renderers never rescan author lists.
+    own_author_index: int | None = None
+    author_count: int | None = None
+    category: str | None = None  # "refereed", "preprint" or "nth"
+    venue: str | None = None
+    # Sidecars of papers read from disk: full author lists (when ``authors`` was
+    # stored truncated) and abstracts. Not written to the JSON.
+    authors_sidecar: Path | None = field(default=None, repr=False, compare=False)
+    abstract_store: Path | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.author_count is None:
+            self.derive_fields()
+
+    @property
+    def authors_truncated(self) -> bool:
+        return self.author_count is not None and len(self.authors) < self.author_count
+
+    def full_authors(self) -> list[str]:
+        """Return the complete author list, loading it from the sidecar if ``authors`` is truncated.
+
+        Falls back to the stored names when the sidecar is missing. Renderers
+        should use ``authors`` and ``author_count``, which never touch the sidecar.
+        """
+        if self.authors_truncated and self.authors_sidecar is not None:
+            full = load_author_sidecar(self.authors_sidecar).get(self.bibcode)
+            if full and len(full) == self.author_count:
+                self.authors = list(full)
+        return self.authors
+
+    @property
+    def has_abstract(self) -> bool:
+        return bool(self.abstract or self.abstract_hash)
+
+    def load_abstract(self) -> str | None:
+        """Return the abstract, reading it from the abstract store on first use."""
+        if self.abstract is None and self.abstract_hash and self.abstract_store is not None:
+            self.abstract = load_abstract_store(self.abstract_store).get(self.abstract_hash)
+        return self.abstract
+
+    def derive_fields(self) -> None:
+        if not self.authors_truncated:
+            self.author_count = len(self.authors)
+            self.own_author_index = own_author_index(self.authors)
+        self.venue = normalize_venue(self.pub)
+        if self.author_count > NTH_AUTHOR_THRESHOLD:
+            self.category = "nth"
+        else:
+            self.category = "preprint" if self.is_preprint else "refereed"
+
+    @property
+    def is_preprint(self) -> bool:
+        return self.doctype == "eprint" or self.venue == ARXIV_VENUE
 
     @property
     def ads_url(self) -> str:
@@ -70,6 +154,54 @@ class AdsPaper:
         return f"https://inspirehep.net/record/{self.inspire_recid}"
 
 
+def is_own_name(name: str) -> bool:
+    if "," in name:
+        last, first = [part.strip().lower() for part in name.split(",", 1)]
+    else:
+        chunks = name.strip().lower().split()
+        if not chunks:
+            return False
+        last = chunks[-1]
+        first = " ".join(chunks[:-1])
+    return last == OWN_LAST_NAME and first.startswith(OWN_FIRST_NAME_PREFIX)
+
+
+def own_author_index(authors: list[str]) -> int | None:
+    for index, name in enumerate(authors):
+        if is_own_name(name):
+            return index
+    return None
+
+
+def normalize_venue(pub: str) -> str:
+    venue = " ".join(pub.split())
+    return ARXIV_VENUE if "arxiv e-prints" in venue.lower() else venue
+
+
+class HostLimiter:
+    """Cap the number of in-flight requests per host across worker threads."""
+
+    def __init__(self, per_host: int = DEFAULT_PER_HOST_LIMIT) -> None:
+        self.per_host = max(1, per_host)
+        self._lock = threading.Lock()
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+
+    def _semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        with self._lock:
+            sem = self._slots.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.per_host)
+                self._slots[host] = sem
+            return sem
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        sem = self._semaphore(url)
+        with sem:
+            yield
+
+
 def load_dotenv(path: Path) -> None:
     if not path.exists():
         return
@@ -84,11 +216,28 @@ def load_dotenv(path: Path) -> None:
             os.environ[key] = value
 
 
-def fetch_ads_docs(token: str, author_name: str, rows: int = 500) -> list[dict]:
+def iter_ads_docs(
+    token: str,
+    author_name: str,
+    rows: int = 500,
+    since: str | None = None,
+    watermark_field: str = DEFAULT_WATERMARK_FIELD,
+    max_docs: int | None = None,
+    include_abstract: bool = False,
+) -> Iterator[dict]:
+    """Yield the author's ADS records, one ``rows``-sized cursorMark page at a time.
+
+    ``since`` restricts the query to records whose ``watermark_field``
+    (``entry_date`` or ``indexstamp``) is at or after it; the field is always
+    requested so callers can advance the mark. Only one page is held in memory.
+    ``include_abstract`` adds ``abstract`` to the returned fields.
+    """
     query = (
         f'author:"{author_name}" AND doctype:(article OR eprint) '
         "AND -pub:(\"APS Meeting Abstracts\" OR \"Bulletin of the American Physical Society\")"
     )
+    if since:
+        query += f' AND {watermark_field}:["{since}" TO *]'
     params = {
         "q": query,
         "fl": ",".join(
@@ -105,42 +254,57 @@ def fetch_ads_docs(token: str, author_name: str, rows: int = 500) -> list[dict]:
                 "volume",
                 "page",
                 "citation_count",
+                watermark_field,
+                *(["abstract"] if include_abstract else []),
             ]
         ),
         "rows": str(rows),
-        "sort": "date desc",
+        # cursorMark paging needs a sort that ends on a unique field.
+        "sort": "date desc, bibcode desc",
     }
-    req = urllib.request.Request(
-        f"{ADS_API_URL}?{urllib.parse.urlencode(params)}",
-        headers={"Authorization": f"Bearer {token}", "User-Agent": "ads-data-sync-script"},
-    )
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        payload = json.loads(resp.read().decode("utf-8"))
-    return payload.get("response", {}).get("docs", [])
 
+    cursor = "*"
+    yielded = 0
+    while True:
+        params["cursorMark"] = cursor
+        payload = json.loads(
+            CLIENT.get(f"{ADS_API_URL}?{urllib.parse.urlencode(params)}", headers={"Authorization": f"Bearer {token}"})
+        )
+        docs = payload.get("response", {}).get("docs", [])
+        for doc in docs:
+            if max_docs is not None and yielded >= max_docs:
+                return
+            yielded += 1
+            yield doc
 
-def fetch_abstracts_for_bibcodes(token: str, bibcodes: list[str], chunk_size: int = 20) -> dict[str, str]:
-    abstracts: dict[str, str] = {}
-    if not bibcodes:
-        return abstracts
+        next_cursor = payload.get("nextCursorMark")
+        if len(docs) < rows or not next_cursor or next_cursor == cursor:
+            return
+        cursor = next_cursor
 
-    for i in range(0, len(bibcodes), chunk_size):
-        chunk = [b.strip() for b in bibcodes[i : i + chunk_size] if b and b.strip()]
-        if not chunk:
-            continue
 
-        terms = " OR ".join(f"bibcode:\"{b}\"" for b in chunk)
+def fetch_abstracts_for_bibcodes(token: str, bibcodes: list[str], chunk_size: int = 2000) -> dict[str, str]:
+    """Fetch abstracts for known bibcodes through the ADS bigquery endpoint.
+
+    Each request POSTs up to ``chunk_size`` bibcodes (the ADS bigquery limit)
+    as a newline-separated list.
+    """
+    abstracts: dict[str, str] = {}
+    cleaned = [b.strip() for b in bibcodes if b and b.strip()]
+    for i in range(0, len(cleaned), chunk_size):
+        chunk = cleaned[i : i + chunk_size]
         params = {
-            "q": f"({terms})",
+            "q": "*:*",
             "fl": "bibcode,abstract",
             "rows": str(len(chunk)),
         }
-        req = urllib.request.Request(
-            f"{ADS_API_URL}?{urllib.parse.urlencode(params)}",
-            headers={"Authorization": f"Bearer {token}", "User-Agent": "ads-data-sync-script"},
+        payload = json.loads(
+            CLIENT.post(
+                f"{ADS_BIGQUERY_URL}?{urllib.parse.urlencode(params)}",
+                ("bibcode\n" + "\n".join(chunk)).encode("utf-8"),
+                headers={"Authorization": f"Bearer {token}", "Content-Type": "big-query/csv"},
+            )
         )
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
         docs = payload.get("response", {}).get("docs", [])
         for doc in docs:
             bibcode = (doc.get("bibcode") or "").strip()
@@ -151,6 +315,30 @@ def fetch_abstracts_for_bibcodes(token: str, bibcodes: list[str], chunk_size: in
     return abstracts
 
 
+def fetch_citation_counts(token: str, bibcodes: list[str], chunk_size: int = 50) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for i in range(0, len(bibcodes), chunk_size):
+        chunk = [b.strip() for b in bibcodes[i : i + chunk_size] if b and b.strip()]
+        if not chunk:
+            continue
+
+        terms = " OR ".join(f"bibcode:\"{b}\"" for b in chunk)
+        params = {
+            "q": f"({terms})",
+            "fl": "bibcode,citation_count",
+            "rows": str(len(chunk)),
+        }
+        payload = json.loads(
+            CLIENT.get(f"{ADS_API_URL}?{urllib.parse.urlencode(params)}", headers={"Authorization": f"Bearer {token}"})
+        )
+        for doc in payload.get("response", {}).get("docs", []):
+            bibcode = (doc.get("bibcode") or "").strip()
+            if bibcode:
+                counts[bibcode] = int(doc.get("citation_count") or 0)
+
+    return counts
+
+
 def _extract_arxiv_id(identifiers: Iterable[str]) -> str | None:
     for ident in identifiers:
         m = re.search(r"(?i)arxiv:([a-z\-]+/\d{7}|\d{4}\.\d{4,5}(?:v\d+)?)", ident)
@@ -175,31 +363,87 @@ def _extract_doi(identifiers: Iterable[str]) -> str | None:
     return None
 
 
-def _fetch_inspire_control_number(arxiv_id: str | None, doi: str | None) -> str | None:
+def _fetch_inspire_batch(
+    pairs: list[tuple[str | None, str | None]],
+    limiter: HostLimiter | None = None,
+) -> dict[str, str]:
+    """Resolve many identifiers with one OR-combined INSPIRE query.
+
+    Returns control numbers keyed by ``arxiv:<id>`` / ``doi:<doi>``; identifiers
+    INSPIRE did not return are simply absent. A failed request yields ``{}``.
+    """
+    terms: list[str] = []
+    for arxiv_id, doi in pairs:
+        if arxiv_id:
+            terms.append(arxiv_key(arxiv_id))
+        if doi:
+            terms.append(f'doi:"{doi.strip()}"')
+    if not terms:
+        return {}
+
+    params = {
+        "q": " or ".join(terms),
+        "fields": "control_number,arxiv_eprints,dois",
+        "size": str(len(terms)),
+    }
+    url = f"{INSPIRE_API_URL}?" + urllib.parse.urlencode(params)
+    try:
+        with limiter.slot(url) if limiter else nullcontext():
+            payload = json.loads(CLIENT.get(url))
+    except Exception:
+        return {}
+
+    resolved: dict[str, str] = {}
+    for hit in payload.get("hits", {}).get("hits") or []:
+        metadata = hit.get("metadata") or {}
+        cn = metadata.get("control_number")
+        if not cn:
+            continue
+        for eprint in metadata.get("arxiv_eprints") or []:
+            value = (eprint or {}).get("value")
+            if value:
+                resolved.setdefault(arxiv_key(value), str(cn))
+        for doi in metadata.get("dois") or []:
+            value = (doi or {}).get("value")
+            if value:
+                resolved.setdefault(doi_key(value), str(cn))
+    return resolved
+
+
+def _fetch_inspire_control_number(
+    arxiv_id: str | None,
+    doi: str | None,
+    limiter: HostLimiter | None = None,
+) -> str | None:
+    """Look up one paper by arXiv id, then DOI; ``None`` means INSPIRE has no record.
+
+    When a query fails and none succeeds with a hit, the error is re-raised so
+    the caller does not mistake an outage for a miss.
+    """
     queries: list[str] = []
     if arxiv_id:
         queries.append(f"arxiv:{arxiv_id}")
     if doi:
         queries.append(f"doi:{doi}")
 
+    error: Exception | None = None
     for q in queries:
-        url = (
-            "https://inspirehep.net/api/literature?"
-            + urllib.parse.urlencode({"q": q, "fields": "control_number", "size": "1"})
-        )
-        req = urllib.request.Request(url, headers={"User-Agent": "ads-data-sync-script"})
+        url = f"{INSPIRE_API_URL}?" + urllib.parse.urlencode({"q": q, "fields": "control_number", "size": "1"})
         try:
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                payload = json.loads(resp.read().decode("utf-8"))
-            hits = payload.get("hits", {}).get("hits") or []
-            if not hits:
-                continue
-            cn = hits[0].get("metadata", {}).get("control_number")
-            if cn:
-                return str(cn)
-        except Exception:
+            with limiter.slot(url) if limiter else nullcontext():
+                payload = json.loads(CLIENT.get(url, timeout=20))
+        except Exception as exc:
+            error = exc
+            continue
+        hits = payload.get("hits", {}).get("hits") or []
+        if not hits:
             continue
+        cn = hits[0].get("metadata", {}).get("control_number")
+        if cn:
+            return str(cn)
 
+    if error is not None:
+        raise error
     return None
 
 
@@ -251,7 +495,7 @@ def _paper_from_doc(doc: dict) -> AdsPaper | None:
         doi=_extract_doi(identifiers),
         inspire_recid=_extract_inspire_recid(identifiers),
         citation_count=int(doc.get("citation_count") or 0),
-        abstract=None,
+        abstract=(doc.get("abstract") or "").strip() or None,
         topics=[],
         topic_source=None,
         topic_confidence=None,
@@ -259,13 +503,6 @@ def _paper_from_doc(doc: dict) -> AdsPaper | None:
     )
 
 
-def _dedupe_key(paper: AdsPaper) -> str:
-    if paper.arxiv_id:
-        return f"arxiv:{paper.arxiv_id.lower()}"
-    norm_title = re.sub(r"\W+", "", paper.title.lower())
-    return f"title:{norm_title}"
-
-
 def _priority(paper: AdsPaper) -> tuple[int, int, int, int, str]:
     return (
         1 if paper.doctype == "article" else 0,
@@ -276,50 +513,193 @@ def _priority(paper: AdsPaper) -> tuple[int, int, int, int, str]:
     )
 
 
-def clean_and_dedupe(docs: list[dict]) -> list[AdsPaper]:
+def _keep_best(index: IdentityIndex, chosen: dict[str, AdsPaper], paper: AdsPaper, replace_ties: bool = False) -> None:
+    """Fold ``paper`` into the record chosen for its identity, keeping the higher ``_priority``."""
+    group_id, merged = index.add(paper_aliases(paper))
+    current = chosen.get(group_id)
+    for other_id in merged:
+        other = chosen.pop(other_id, None)
+        if other is not None and (current is None or _priority(other) > _priority(current)):
+            current = other
+    if current is None or _priority(paper) > _priority(current) or (replace_ties and _priority(paper) == _priority(current)):
+        current = paper
+    chosen[group_id] = current
+
+
+def drop_near_duplicates(papers: list[AdsPaper]) -> list[AdsPaper]:
+    """Keep the highest-``_priority`` record of each fuzzy near-duplicate group.
+
+    The kept record inherits a stored ``paper_id`` from the records it replaces,
+    so their enrichment carries over.
+    """
+    dropped: set[int] = set()
+    for members in near_duplicate_groups(papers):
+        best = max(members, key=lambda i: _priority(papers[i]))
+        for i in members:
+            if i != best:
+                dropped.add(i)
+                papers[best].paper_id = papers[best].paper_id or papers[i].paper_id
+    return [paper for i, paper in enumerate(papers) if i not in dropped]
+
+
+def clean_and_dedupe(docs: Iterable[dict], near_duplicates: bool = True) -> list[AdsPaper]:
+    """Parse and filter ADS docs, keeping the best record per paper identity.
+
+    With ``near_duplicates`` a fuzzy pass then folds retitled, erratum and split
+    records that share no identifier.
+    """
+    index = IdentityIndex()
     chosen: dict[str, AdsPaper] = {}
     for doc in docs:
         paper = _paper_from_doc(doc)
-        if not paper:
-            continue
-        key = _dedupe_key(paper)
-        existing = chosen.get(key)
-        if existing is None or _priority(paper) > _priority(existing):
-            chosen[key] = paper
+        if paper:
+            _keep_best(index, chosen, paper)
+
+    papers = list(chosen.values())
+    if near_duplicates:
+        papers = drop_near_duplicates(papers)
+    papers.sort(key=lambda paper: (paper.pubdate, paper.year), reverse=True)
+    return papers
+
+
+def _run_lookups(fn, items: list, workers: int) -> list:
+    if workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+        return list(pool.map(fn, items))
+
+
+def merge_papers(existing: list[AdsPaper], fresh: list[AdsPaper], near_duplicates: bool = True) -> list[AdsPaper]:
+    """Fold freshly fetched papers into a previously stored set.
+
+    A fresh record replaces a stored one with the same bibcode outright, and
+    otherwise competes on ``_priority`` with the stored records of the same
+    paper identity (winning ties).
+    """
+    fresh_bibcodes = {paper.bibcode for paper in fresh}
+    index = IdentityIndex()
+    chosen: dict[str, AdsPaper] = {}
+    for paper in existing:
+        if paper.bibcode not in fresh_bibcodes:
+            _keep_best(index, chosen, paper)
+    for paper in fresh:
+        _keep_best(index, chosen, paper, replace_ties=True)
 
     papers = list(chosen.values())
+    if near_duplicates:
+        papers = drop_near_duplicates(papers)
     papers.sort(key=lambda paper: (paper.pubdate, paper.year), reverse=True)
     return papers
 
 
-def enrich_with_inspire(papers: list[AdsPaper]) -> None:
-    inspire_cache: dict[str, str | None] = {}
+def enrich_with_inspire(
+    papers: list[AdsPaper],
+    workers: int = 1,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    batch_size: int = INSPIRE_BATCH_SIZE,
+    cache: InspireCache | None = None,
+) -> None:
+    """Fill missing INSPIRE record ids, looking up each distinct arXiv/DOI pair once.
+
+    Pairs settled by ``cache`` (a cached record id, or unexpired misses) are not
+    looked up again, and every lookup result is stored back into it. Pairs whose
+    lookups failed are left unresolved and uncached, so the next run retries them.
+
+    Identifiers are first resolved in OR-combined batches of ``batch_size``;
+    only pairs a batch leaves unresolved fall back to per-paper queries. With
+    ``workers > 1`` requests run on a thread pool, bounded per host by
+    ``per_host_limit``. Results are assigned in paper order, so the outcome does
+    not depend on which request finishes first.
+    """
+    pending: dict[str, tuple[str | None, str | None]] = {}
     for paper in papers:
         if paper.inspire_recid:
             continue
         cache_key = f"{paper.arxiv_id or ''}|{paper.doi or ''}"
-        if cache_key not in inspire_cache:
-            inspire_cache[cache_key] = _fetch_inspire_control_number(paper.arxiv_id, paper.doi)
-        paper.inspire_recid = inspire_cache[cache_key]
+        pending.setdefault(cache_key, (paper.arxiv_id, paper.doi))
+
+    inspire_cache: dict[str, str | None] = {key: None for key in pending}
+    keys: list[str] = []
+    for key, (arxiv_id, doi) in pending.items():
+        if not (arxiv_id or doi):
+            continue
+        if cache is not None:
+            settled, recid = cache.resolve(arxiv_id, doi)
+            if settled:
+                inspire_cache[key] = recid
+                continue
+        keys.append(key)
+    limiter = HostLimiter(per_host_limit)
+
+    if batch_size > 1:
+        chunks = [keys[i : i + batch_size] for i in range(0, len(keys), batch_size)]
+        batch_results = _run_lookups(
+            lambda chunk: _fetch_inspire_batch([pending[key] for key in chunk], limiter=limiter),
+            chunks,
+            workers,
+        )
+        resolved: dict[str, str] = {}
+        for result in batch_results:
+            for ident, cn in result.items():
+                resolved.setdefault(ident, cn)
+        for key in keys:
+            arxiv_id, doi = pending[key]
+            if arxiv_id and arxiv_key(arxiv_id) in resolved:
+                inspire_cache[key] = resolved[arxiv_key(arxiv_id)]
+            elif doi and doi_key(doi) in resolved:
+                inspire_cache[key] = resolved[doi_key(doi)]
+
+    failed: set[str] = set()
+
+    def lookup(key: str) -> str | None:
+        try:
+            return _fetch_inspire_control_number(*pending[key], limiter=limiter)
+        except Exception:
+            failed.add(key)
+            return None
+
+    unresolved = [key for key in keys if inspire_cache[key] is None]
+    fallback = _run_lookups(lookup, unresolved, workers)
+    inspire_cache.update(zip(unresolved, fallback))
+    if cache is not None:
+        for key in keys:
+            if key not in failed:
+                cache.store(*pending[key], inspire_cache[key])
+
+    for paper in papers:
+        if paper.inspire_recid:
+            continue
+        paper.inspire_recid = inspire_cache[f"{paper.arxiv_id or ''}|{paper.doi or ''}"]
 
 
 def load_enrichment_map(path: Path) -> dict[str, dict]:
+    """Return the stored enrichment fields keyed by paper id.
+
+    Files written before ``paper_id`` was stored fall back to the id derived
+    from the paper's aliases, which is what ``IdentityIndex`` assigns them.
+    """
     if not path.exists():
         return {}
     payload = json.loads(path.read_text(encoding="utf-8"))
     papers_data = payload.get("papers") or []
-    enrichment_by_bibcode: dict[str, dict] = {}
+    store = abstract_store_path(path)
+    enrichment_by_id: dict[str, dict] = {}
     for raw in papers_data:
-        bibcode = (raw.get("bibcode") or "").strip()
-        if not bibcode:
+        aliases = identity_aliases(
+            raw.get("bibcode"), raw.get("arxiv_id"), raw.get("doi"), raw.get("inspire_recid"), raw.get("title")
+        )
+        paper_id = raw.get("paper_id") or (aliases[0] if aliases else None)
+        if not paper_id:
             continue
         enriched: dict = {}
         for key in ENRICHMENT_FIELDS:
             if key in raw:
                 enriched[key] = raw.get(key)
+        if raw.get("abstract_hash") and "abstract" not in raw:
+            enriched["abstract"] = load_abstract_store(store).get(raw["abstract_hash"])
         if enriched:
-            enrichment_by_bibcode[bibcode] = enriched
-    return enrichment_by_bibcode
+            enrichment_by_id.setdefault(paper_id, enriched)
+    return enrichment_by_id
 
 
 def _with_default_enrichment(raw: dict) -> dict:
@@ -336,25 +716,125 @@ def _with_default_enrichment(raw: dict) -> dict:
     return raw
 
 
-def write_papers_json(path: Path, papers: list[AdsPaper], enrichment_by_bibcode: dict[str, dict] | None = None) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+def read_sync_state(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    state = payload.get("sync_state")
+    return dict(state) if isinstance(state, dict) else {}
+
+
+def author_sidecar_path(path: Path) -> Path:
+    """``data/ads_publications.json`` -> ``data/ads_publications_authors.json``."""
+    return path.with_name(f"{path.stem}_authors{path.suffix}")
+
+
+def abstract_store_path(path: Path) -> Path:
+    """``data/ads_publications.json`` -> ``data/ads_publications_abstracts.json``."""
+    return path.with_name(f"{path.stem}_abstracts{path.suffix}")
+
+
+def abstract_key(abstract: str) -> str:
+    return hashlib.sha256(abstract.encode("utf-8")).hexdigest()[:16]
+
+
+_SIDECARS: dict[Path, dict] = {}
+
+
+def _load_sidecar(path: Path, key: str) -> dict:
+    """``payload[key]`` of a sidecar JSON, read once per process; empty when the file is missing."""
+    if path not in _SIDECARS:
+        payload = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        _SIDECARS[path] = dict(payload.get(key) or {})
+    return _SIDECARS[path]
+
+
+def _write_sidecar(path: Path, key: str, entries: dict) -> None:
+    write_json_if_changed(path, {"schema_version": 1, key: entries})
+    _SIDECARS[path] = entries
+
+
+def load_author_sidecar(path: Path) -> dict[str, list[str]]:
+    """Full author lists of compacted papers, keyed by bibcode."""
+    return _load_sidecar(path, "authors")
+
+
+def load_abstract_store(path: Path) -> dict[str, str]:
+    """Abstracts keyed by ``abstract_key`` (content-addressed, so unchanged text keeps its key)."""
+    return _load_sidecar(path, "abstracts")
+
+
+def write_papers_json(
+    path: Path,
+    papers: list[AdsPaper],
+    enrichment_by_bibcode: dict[str, dict] | None = None,
+    sync_state: dict | None = None,
+    compact_authors_above: int | None = COMPACT_AUTHORS_ABOVE,
+) -> None:
+    """Write the canonical papers JSON, its authors sidecar and its abstract store.
+
+    Papers with more than ``compact_authors_above`` authors keep only the first
+    ``COMPACT_AUTHORS_KEPT`` names (plus ``author_count`` and ``own_author_index``)
+    in the main file; their full lists go to the sidecar. ``None`` or 0 stores
+    every list in full. Abstracts are replaced by their ``abstract_hash``.
+    """
     rows: list[dict] = []
+    full_authors: dict[str, list[str]] = {}
+    abstracts: dict[str, str] = {}
     for paper in papers:
+        authors = paper.full_authors()
+        paper.load_abstract()
+        paper.derive_fields()
         row = asdict(paper)
+        del row["authors_sidecar"], row["abstract_store"]
+        if compact_authors_above and len(authors) > compact_authors_above:
+            row["authors"] = authors[:COMPACT_AUTHORS_KEPT]
+            full_authors[paper.bibcode] = authors
         if enrichment_by_bibcode and paper.bibcode in enrichment_by_bibcode:
             row.update(enrichment_by_bibcode[paper.bibcode])
-        rows.append(_with_default_enrichment(row))
+        row = _with_default_enrichment(row)
+        abstract = row.pop("abstract")
+        row["abstract_hash"] = abstract_key(abstract) if abstract else None
+        if abstract:
+            abstracts[row["abstract_hash"]] = abstract
+        rows.append(row)
 
     payload = {
-        "schema_version": 2,
+        "schema_version": 3,
         "papers": rows,
     }
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if sync_state:
+        payload["sync_state"] = sync_state
+    write_json_if_changed(path, payload)
+
+    _write_sidecar(author_sidecar_path(path), "authors", full_authors)
+    _write_sidecar(abstract_store_path(path), "abstracts", abstracts)
+
+
+def patch_citation_counts(path: Path, counts: dict[str, int]) -> int:
+    """Update ``citation_count`` in the stored JSON in place; return how many changed."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    changed = 0
+    for raw in payload.get("papers") or []:
+        bibcode = (raw.get("bibcode") or "").strip()
+        if bibcode in counts and int(raw.get("citation_count") or 0) != counts[bibcode]:
+            raw["citation_count"] = counts[bibcode]
+            changed += 1
+    if changed:
+        write_json_if_changed(path, payload)
+    return changed
 
 
 def read_papers_json(path: Path) -> list[AdsPaper]:
+    """Read the canonical papers JSON without touching its sidecars.
+
+    Truncated author lists stay truncated until ``full_authors()`` and abstracts
+    are only read by ``load_abstract()``.
+    """
     payload = json.loads(path.read_text(encoding="utf-8"))
     papers_data = payload.get("papers") or []
+    sidecar = author_sidecar_path(path)
+    store = abstract_store_path(path)
     papers: list[AdsPaper] = []
     for raw in papers_data:
         papers.append(
@@ -374,6 +854,7 @@ def read_papers_json(path: Path) -> list[AdsPaper]:
                 inspire_recid=raw.get("inspire_recid"),
                 citation_count=int(raw.get("citation_count") or 0),
                 abstract=raw.get("abstract"),
+                abstract_hash=raw.get("abstract_hash"),
                 topics=list(raw.get("topics") or []),
                 topic_source=raw.get("topic_source"),
                 topic_confidence=(
@@ -382,6 +863,13 @@ def read_papers_json(path: Path) -> list[AdsPaper]:
                     else None
                 ),
                 topics_classified_with=raw.get("topics_classified_with"),
+                paper_id=raw.get("paper_id"),
+                own_author_index=raw.get("own_author_index"),
+                author_count=raw.get("author_count"),
+                category=raw.get("category"),
+                venue=raw.get("venue"),
+                authors_sidecar=sidecar,
+                abstract_store=store,
             )
         )
     papers.sort(key=lambda paper: (paper.pubdate, paper.year), reverse=True)
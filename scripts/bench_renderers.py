@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Benchmark the publication renderers on synthetic ADS corpora.
+
+Generates seeded corpora (default 1k, 10k and 100k papers, a tail of large
+collaborations with up to several thousand authors, long abstracts), then times
+each renderer (best of ``--repeat``) and measures its peak allocation with
+tracemalloc. Results are written as a JSON baseline; ``--compare`` re-runs the
+suite and fails when a renderer got slower or hungrier than the baseline allows.
+
+Usage:
+  python scripts/bench_renderers.py
+  python scripts/bench_renderers.py --sizes 1000,10000 --out /tmp/bench.json
+  python scripts/bench_renderers.py --compare data/bench_renderers.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from ads_data import AdsPaper
+from cv_profile import DEFAULT_PROFILE_JSON, read_cv_profile
+from outputs import write_json_if_changed
+from sync_compact_cv import DEFAULT_SELECTED_LIMIT, render_compact_cv
+from sync_cv import render_nth, render_refereed, split_papers
+from sync_publications import DEFAULT_TOPICS_JSON, load_topics, render_entries
+from sync_publist import DEFAULT_HIGHLIGHTS, DEFAULT_NAME, render_document, sort_highlights
+
+DEFAULT_OUT = "data/bench_renderers.json"
+DEFAULT_SIZES = "1000,10000,100000"
+DEFAULT_MAX_AUTHORS = 3000
+DEFAULT_ABSTRACT_WORDS = 600
+OWN_NAME = "Venumadhav, Tejaswi"
+NTH_THRESHOLD = 12
+
+# (weight, min_authors, max_authors); the last band is capped by --max-authors.
+AUTHOR_BANDS = ((0.60, 1, 12), (0.25, 13, 60), (0.13, 61, 500), (0.02, 1000, None))
+WORDS = (
+    "black hole neutron star merger gravitational wave lensing cosmology dark matter reionization "
+    "recombination gamma ray burst signal noise template bank detector posterior spin mass redshift "
+    "population inference likelihood catalog observing run waveform binary coalescence hydrogen "
+    "twenty one centimeter fluctuations plasma magnetar radio transient survey"
+).split()
+
+
+def synthetic_corpus(
+    size: int,
+    topics: list[str],
+    seed: int = 0,
+    max_authors: int = DEFAULT_MAX_AUTHORS,
+    abstract_words: int = DEFAULT_ABSTRACT_WORDS,
+) -> list[AdsPaper]:
+    """Return ``size`` reproducible papers shaped like ADS records of the site owner."""
+    rng = random.Random(seed)
+    name_pool = [f"Author{i:05d}, {chr(65 + i % 26)}. {chr(65 + (i // 26) % 26)}." for i in range(20000)]
+    weights = [band[0] for band in AUTHOR_BANDS]
+    papers: list[AdsPaper] = []
+    for i in range(size):
+        _, low, high = rng.choices(AUTHOR_BANDS, weights)[0]
+        n_authors = rng.randint(low, high or max(low, max_authors))
+        authors = rng.sample(name_pool, min(n_authors, len(name_pool)))
+        authors[rng.randrange(min(n_authors, 6) if n_authors <= NTH_THRESHOLD else n_authors)] = OWN_NAME
+        year = 2010 + i % 16
+        eprint = rng.random() < 0.3
+        title = " ".join(rng.choices(WORDS, k=rng.randint(8, 20))).capitalize()
+        if rng.random() < 0.2:
+            title += " with $z_{\\rm re}$ & 10% noise"
+        papers.append(
+            AdsPaper(
+                title=title,
+                authors=authors,
+                year=year,
+                bibcode=f"{year}Syn..{i:07d}V",
+                doctype="eprint" if eprint else "article",
+                pub="arXiv e-prints" if eprint else rng.choice(["Physical Review D", "The Astrophysical Journal"]),
+                pub_raw="",
+                pubdate=f"{year}-{1 + i % 12:02d}-00",
+                volume="" if eprint else str(rng.randint(1, 999)),
+                page=f"{rng.randint(1, 99999)}",
+                arxiv_id=f"{year % 100:02d}{1 + i % 12:02d}.{i % 100000:05d}",
+                doi=None if eprint else f"10.1103/Syn.{i}",
+                inspire_recid=str(1000000 + i) if rng.random() < 0.7 else None,
+                citation_count=int(rng.paretovariate(1.2)) - 1,
+                abstract=" ".join(rng.choices(WORDS, k=rng.randint(abstract_words // 4, abstract_words))),
+                topics=rng.sample(topics, rng.randint(0, min(3, len(topics)))),
+                topic_source="llm",
+            )
+        )
+    return papers
+
+
+def renderers(topics: list[str], profile: dict) -> dict[str, Callable[[list[AdsPaper]], str]]:
+    def publications(papers: list[AdsPaper]) -> str:
+        return render_entries(papers, topics)[0]
+
+    def cv_refereed(papers: list[AdsPaper]) -> str:
+        return render_refereed(split_papers(papers, NTH_THRESHOLD)[0])
+
+    def cv_nth(papers: list[AdsPaper]) -> str:
+        return render_nth(split_papers(papers, NTH_THRESHOLD)[2])
+
+    def publist(papers: list[AdsPaper]) -> str:
+        refereed, preprints, nth = split_papers(papers, NTH_THRESHOLD)
+        highlights = sort_highlights(refereed)[:DEFAULT_HIGHLIGHTS]
+        return render_document(DEFAULT_NAME, highlights, refereed, preprints, nth)
+
+    def compact_cv(papers: list[AdsPaper]) -> str:
+        return render_compact_cv(papers, DEFAULT_SELECTED_LIMIT, profile)
+
+    return {
+        "publications.render_entries": publications,
+        "cv.render_refereed": cv_refereed,
+        "cv.render_nth": cv_nth,
+        "publist.render_document": publist,
+        "compact_cv.render_compact_cv": compact_cv,
+    }
+
+
+def measure(fn: Callable[[list[AdsPaper]], str], papers: list[AdsPaper], repeat: int) -> dict[str, float]:
+    best = float("inf")
+    output = ""
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        output = fn(papers)
+        best = min(best, time.perf_counter() - start)
+    del output
+
+    tracemalloc.start()
+    output = fn(papers)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": round(best, 4),
+        "peak_mib": round(peak / (1 << 20), 2),
+        "output_kib": round(len(output.encode("utf-8")) / 1024, 1),
+    }
+
+
+def run_suite(sizes: list[int], seed: int, max_authors: int, abstract_words: int, repeat: int) -> dict:
+    topics = load_topics(Path(DEFAULT_TOPICS_JSON))
+    suite = renderers(topics, read_cv_profile(DEFAULT_PROFILE_JSON))
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for size in sizes:
+        papers = synthetic_corpus(size, topics, seed=seed, max_authors=max_authors, abstract_words=abstract_words)
+        authors = sum(len(paper.authors) for paper in papers)
+        print(f"corpus={size} papers, {authors} author entries, max={max(len(p.authors) for p in papers)}")
+        results[str(size)] = {}
+        for name, fn in suite.items():
+            row = measure(fn, papers, repeat)
+            results[str(size)][name] = row
+            print(f"  {name:<30} {row['seconds']:9.4f}s  peak={row['peak_mib']:8.2f} MiB  out={row['output_kib']:.0f} KiB")
+    return {
+        "schema_version": 1,
+        "python": platform.python_version(),
+        "corpus": {"seed": seed, "max_authors": max_authors, "abstract_words": abstract_words},
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, time_factor: float, memory_factor: float) -> list[str]:
+    """Return regressions of ``current`` against ``baseline`` beyond the allowed factors."""
+    problems: list[str] = []
+    for size, rows in current["results"].items():
+        for name, row in rows.items():
+            base = (baseline.get("results") or {}).get(size, {}).get(name)
+            if not base:
+                continue
+            # Renders under 50ms are too noisy to compare.
+            if row["seconds"] > max(0.05, base["seconds"] * time_factor):
+                problems.append(f"{name} @ {size}: {row['seconds']:.4f}s vs baseline {base['seconds']:.4f}s")
+            if row["peak_mib"] > max(1.0, base["peak_mib"] * memory_factor):
+                problems.append(f"{name} @ {size}: {row['peak_mib']:.2f} MiB vs baseline {base['peak_mib']:.2f} MiB")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated corpus sizes.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-authors", type=int, default=DEFAULT_MAX_AUTHORS)
+    parser.add_argument("--abstract-words", type=int, default=DEFAULT_ABSTRACT_WORDS)
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per renderer (best is kept).")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="Where to write the JSON results.")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to check against instead of writing --out.")
+    parser.add_argument("--time-factor", type=float, default=1.5)
+    parser.add_argument("--memory-factor", type=float, default=1.25)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    current = run_suite(sizes, args.seed, args.max_authors, args.abstract_words, args.repeat)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        problems = compare(baseline, current, args.time_factor, args.memory_factor)
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        if not problems:
+            print(f"No regressions against {args.compare}")
+        return 1 if problems else 0
+
+    write_json_if_changed(Path(args.out), current)
+    print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Content-hash stamps for skipping build steps whose inputs are unchanged.
+
+Each step records the sha256 of its input and output files after it runs. A
+step is up to date when every input hashes the same as last time and every
+output still exists with the recorded hash.
+
+Usage:
+  python scripts/build_stamps.py --list
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+from outputs import write_json_if_changed
+
+DEFAULT_STAMPS_JSON = "data/pipeline_stamps.json"
+
+
+def file_digest(path: Path) -> str | None:
+    if not path.exists():
+        return None
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def digests(paths: list[Path]) -> dict[str, str | None]:
+    return {path.as_posix(): file_digest(path) for path in paths}
+
+
+class BuildStamps:
+    def __init__(self, path: Path, steps: dict[str, dict] | None = None) -> None:
+        self.path = path
+        self.steps: dict[str, dict] = steps or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "BuildStamps":
+        steps: dict[str, dict] = {}
+        if path.exists():
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            raw = payload.get("steps") or {}
+            steps = {str(name): value for name, value in raw.items() if isinstance(value, dict)}
+        return cls(path, steps)
+
+    def reasons(self, name: str, inputs: list[Path], outputs: list[Path]) -> list[str]:
+        """Return why step ``name`` must run; an empty list means it is up to date."""
+        stamp = self.steps.get(name)
+        if stamp is None:
+            return ["no previous stamp"]
+        recorded_inputs = stamp.get("inputs") or {}
+        recorded_outputs = stamp.get("outputs") or {}
+        out: list[str] = []
+        for key, digest in digests(inputs).items():
+            if key not in recorded_inputs:
+                out.append(f"new input {key}")
+            elif digest is None:
+                if recorded_inputs[key] is not None:
+                    out.append(f"input removed {key}")
+            elif recorded_inputs[key] != digest:
+                out.append(f"input changed {key}")
+        for key in sorted(set(recorded_inputs) - {path.as_posix() for path in inputs}):
+            out.append(f"input dropped {key}")
+        for key, digest in digests(outputs).items():
+            if digest is None:
+                out.append(f"output missing {key}")
+            elif recorded_outputs.get(key) != digest:
+                out.append(f"output modified {key}")
+        return out
+
+    def record(self, name: str, inputs: list[Path], outputs: list[Path]) -> None:
+        stamp = {"inputs": digests(inputs), "outputs": digests(outputs)}
+        if self.steps.get(name) != stamp:
+            self.steps[name] = stamp
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty and self.path.exists():
+            return
+        payload = {
+            "schema_version": 1,
+            "steps": {name: self.steps[name] for name in sorted(self.steps)},
+        }
+        write_json_if_changed(self.path, payload)
+        self.dirty = False
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stamps", default=DEFAULT_STAMPS_JSON)
+    parser.add_argument("--list", action="store_true", help="Print recorded inputs and outputs per step.")
+    args = parser.parse_args()
+
+    stamps = BuildStamps.load(Path(args.stamps))
+    for name in sorted(stamps.steps):
+        stamp = stamps.steps[name]
+        print(f"{name}: inputs={len(stamp.get('inputs') or {})}, outputs={len(stamp.get('outputs') or {})}")
+        if args.list:
+            for kind in ("inputs", "outputs"):
+                for key, digest in sorted((stamp.get(kind) or {}).items()):
+                    print(f"  {kind[:-1]:<6} {(digest or 'absent')[:12]}  {key}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
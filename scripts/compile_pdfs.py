@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Compile the generated CV/publist TeX files to PDF in parallel.
+
+Each document is built by latexmk in its own temporary output directory in a
+separate process, and the PDF is copied next to its ``.tex``. Documents whose
+``.tex`` and PDF still match their build stamps are skipped, so a run with no
+TeX changes does no LaTeX work at all.
+
+Builds are reproducible: ``SOURCE_DATE_EPOCH`` pins the PDF dates, the trailer
+/ID is derived from the ``.tex`` hash and the pdfTeX banner is suppressed. A
+rebuilt PDF replaces the committed one only when it differs semantically, i.e.
+beyond dates, IDs and cross-reference offsets.
+
+Usage:
+  python scripts/compile_pdfs.py
+  python scripts/compile_pdfs.py --json
+  python scripts/compile_pdfs.py --list-stale
+  python scripts/compile_pdfs.py --record
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from build_stamps import DEFAULT_STAMPS_JSON, BuildStamps
+from outputs import write_bytes_if_changed
+
+DOCUMENTS = (
+    "cv/generated/Tejaswi_CV_public.tex",
+    "private/cv/Tejaswi_CV_private.tex",
+    "private/cv/Tejaswi_CV_compact.tex",
+    "private/publist/Tejaswi_publist.tex",
+)
+LATEXMK_ARGS = ("-pdf", "-interaction=nonstopmode", "-halt-on-error")
+LOG_TAIL_LINES = 40
+DEFAULT_SOURCE_DATE_EPOCH = "1704067200"  # 2024-01-01T00:00:00Z; overridable via the environment.
+
+STREAM_RE = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.S)
+VOLATILE_RE = re.compile(
+    rb"/(?:CreationDate|ModDate)\s*\([^)]*\)"
+    rb"|/ID\s*\[[^\]]*\]"
+    rb"|/PTEX\.Fullbanner\s*\([^)]*\)"
+    rb"|xref\r?\n.*?trailer"
+    rb"|startxref\s*\d+",
+    re.S,
+)
+
+
+@dataclass
+class CompileResult:
+    tex: str
+    pdf: str
+    status: str  # "compiled", "skipped" or "failed"
+    pdf_change: str | None = None  # "new", "content", "metadata" or "none" for compiled documents
+    seconds: float = 0.0
+    returncode: int | None = None
+    reasons: list[str] | None = None
+    log: str = ""
+
+
+def stamp_name(tex: Path) -> str:
+    return f"pdf:{tex.as_posix()}"
+
+
+def stale_documents(stamps: BuildStamps, documents: list[Path], force: bool = False) -> dict[Path, list[str]]:
+    """Return the documents that need compiling, with the reasons."""
+    out: dict[Path, list[str]] = {}
+    for tex in documents:
+        reasons = ["--force"] if force else stamps.reasons(stamp_name(tex), [tex], [tex.with_suffix(".pdf")])
+        if reasons:
+            out[tex] = reasons
+    return out
+
+
+def pdf_fingerprint(data: bytes) -> str:
+    """Hash a PDF ignoring dates, trailer IDs, the pdfTeX banner and xref offsets.
+
+    Flate streams are compared decompressed; cross-reference streams are dropped
+    since they only hold byte offsets.
+    """
+    digest = hashlib.sha256()
+    last = 0
+    for match in STREAM_RE.finditer(data):
+        head = data[last : match.start()]
+        digest.update(VOLATILE_RE.sub(b"", head))
+        last = match.end()
+        if b"/XRef" in head[head.rfind(b"obj") :]:
+            continue
+        payload = match.group(1)
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error:
+            pass
+        digest.update(VOLATILE_RE.sub(b"", payload))
+    digest.update(VOLATILE_RE.sub(b"", data[last:]))
+    return digest.hexdigest()
+
+
+def classify_pdf_change(old: bytes | None, new: bytes) -> str:
+    if old is None:
+        return "new"
+    if old == new:
+        return "none"
+    return "metadata" if pdf_fingerprint(old) == pdf_fingerprint(new) else "content"
+
+
+def _reproducible_args(source: Path) -> list[str]:
+    trailer_id = hashlib.sha256(source.read_bytes()).hexdigest()[:32]
+    return [f"-usepretex=\\pdfsuppressptexinfo=-1 \\pdftrailerid{{{trailer_id}}}"]
+
+
+def _compile_one(tex: str) -> tuple[int, float, str, str | None]:
+    """Run latexmk for ``tex`` in a private output directory.
+
+    Returns ``(returncode, seconds, log_tail, pdf_change)``; the PDF next to the
+    ``.tex`` is only replaced for new or content changes.
+    """
+    source = Path(tex)
+    target = source.with_suffix(".pdf")
+    env = dict(os.environ)
+    env.setdefault("SOURCE_DATE_EPOCH", DEFAULT_SOURCE_DATE_EPOCH)
+    pdf_change: str | None = None
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix=f"latex-{source.stem}-") as build_dir:
+        proc = subprocess.run(
+            ["latexmk", *LATEXMK_ARGS, *_reproducible_args(source), f"-output-directory={build_dir}", str(source)],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        built = Path(build_dir) / f"{source.stem}.pdf"
+        if proc.returncode == 0 and built.exists():
+            new = built.read_bytes()
+            pdf_change = classify_pdf_change(target.read_bytes() if target.exists() else None, new)
+            if pdf_change in ("new", "content"):
+                write_bytes_if_changed(target, new)
+        latex_log = Path(build_dir) / f"{source.stem}.log"
+        log_text = latex_log.read_text(encoding="utf-8", errors="replace") if latex_log.exists() else proc.stdout
+    tail = "\n".join((log_text + proc.stderr).splitlines()[-LOG_TAIL_LINES:])
+    return proc.returncode, time.perf_counter() - start, tail, pdf_change
+
+
+def compile_documents(
+    documents: list[Path],
+    stamps: BuildStamps,
+    workers: int | None = None,
+    force: bool = False,
+) -> list[CompileResult]:
+    """Compile stale documents in a process pool and record stamps for successful builds."""
+    stale = stale_documents(stamps, documents, force=force)
+    results = {
+        tex: CompileResult(tex=tex.as_posix(), pdf=tex.with_suffix(".pdf").as_posix(), status="skipped")
+        for tex in documents
+    }
+    if stale:
+        if shutil.which("latexmk") is None:
+            raise SystemExit("latexmk not found. Install MacTeX/TeX Live or run with --no-pdf.")
+        with ProcessPoolExecutor(max_workers=workers or len(stale)) as pool:
+            futures = {tex: pool.submit(_compile_one, tex.as_posix()) for tex in stale}
+            for tex, future in futures.items():
+                returncode, seconds, log, pdf_change = future.result()
+                result = results[tex]
+                result.status = "compiled" if returncode == 0 else "failed"
+                result.pdf_change = pdf_change
+                result.seconds = seconds
+                result.returncode = returncode
+                result.reasons = stale[tex]
+                result.log = log
+                if returncode == 0:
+                    stamps.record(stamp_name(tex), [tex], [tex.with_suffix(".pdf")])
+        stamps.save()
+    return [results[tex] for tex in documents]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("documents", nargs="*", default=list(DOCUMENTS), help="TeX files to compile.")
+    parser.add_argument("--stamps", default=DEFAULT_STAMPS_JSON)
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: one per document).")
+    parser.add_argument("--force", action="store_true", help="Compile even when stamps are current.")
+    parser.add_argument("--json", action="store_true", help="Print results (status, timings, log tails) as JSON.")
+    parser.add_argument("--list-stale", action="store_true", help="Print documents that need compiling and exit.")
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Stamp the current .tex/PDF pairs without compiling (after an external LaTeX build).",
+    )
+    args = parser.parse_args()
+
+    documents = [Path(doc) for doc in args.documents]
+    stamps = BuildStamps.load(Path(args.stamps))
+
+    if args.list_stale:
+        for tex in stale_documents(stamps, documents, force=args.force):
+            print(tex.as_posix())
+        return 0
+    if args.record:
+        for tex in documents:
+            if tex.with_suffix(".pdf").exists():
+                stamps.record(stamp_name(tex), [tex], [tex.with_suffix(".pdf")])
+        stamps.save()
+        return 0
+
+    start = time.perf_counter()
+    results = compile_documents(documents, stamps, workers=args.workers, force=args.force)
+    wall = time.perf_counter() - start
+    failed = [result for result in results if result.status == "failed"]
+
+    if args.json:
+        print(json.dumps({"wall_seconds": wall, "results": [asdict(result) for result in results]}, indent=2))
+    else:
+        for result in results:
+            change = f"  pdf: {result.pdf_change}" if result.pdf_change else ""
+            print(f"{result.status:<9} {result.seconds:7.2f}s  {result.tex}{change}")
+        print(f"PDF wall time: {wall:.2f}s")
+        changed = [result.pdf for result in results if result.pdf_change in ("new", "content")]
+        print(f"PDFs changed: {', '.join(changed)}" if changed else "No PDF content changes.")
+        for result in failed:
+            print(f"\n--- {result.tex} (latexmk exit {result.returncode}) ---\n{result.log}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Local stand-in for the ADS, INSPIRE and OpenAI APIs used by sync_ads_data.py.
+
+Responses are replayed from a recorded fixture (by default the stored
+data/ads_publications.json): ADS search/bigquery return the stored records,
+INSPIRE resolves the stored record ids and OpenAI returns the stored topics.
+Latency, server errors and rate limiting can be injected to measure throughput,
+retry behaviour and concurrency settings reproducibly offline. Responses are
+gzipped when the client asks for it, and ``/_stats`` counts TCP connections so
+keep-alive reuse is visible.
+
+Usage:
+  python scripts/fake_services.py --port 8765 --latency-ms 40 --error-rate 0.05 --rate-limit 20
+  eval "$(python scripts/fake_services.py --port 8765 --print-env)"
+  python scripts/sync_ads_data.py --out /tmp/ads.json --full-resync
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import random
+import re
+import signal
+import threading
+import time
+import urllib.parse
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from ads_data import AdsPaper, read_papers_json
+from inspire_cache import arxiv_key, doi_key
+
+DEFAULT_FIXTURE = "data/ads_publications.json"
+DEFAULT_ENTRY_DATE = "2026-01-01T00:00:00Z"
+
+
+def paper_to_doc(paper: AdsPaper) -> dict:
+    """Render a stored paper back into the ADS search response shape."""
+    identifiers = [f"arXiv:{paper.arxiv_id}"] if paper.arxiv_id else []
+    if paper.doi:
+        identifiers.append(paper.doi)
+    return {
+        "title": [paper.title],
+        "author": paper.full_authors(),
+        "year": str(paper.year),
+        "bibcode": paper.bibcode,
+        "identifier": identifiers,
+        "doctype": paper.doctype,
+        "pub": paper.pub,
+        "pub_raw": paper.pub_raw,
+        "pubdate": paper.pubdate,
+        "volume": paper.volume,
+        "page": [paper.page] if paper.page else [],
+        "citation_count": paper.citation_count,
+        "abstract": paper.load_abstract(),
+        "entry_date": DEFAULT_ENTRY_DATE,
+        "indexstamp": DEFAULT_ENTRY_DATE,
+    }
+
+
+class Fixture:
+    def __init__(self, papers: list[AdsPaper]) -> None:
+        self.papers = papers
+        self.docs = [paper_to_doc(paper) for paper in papers]
+        self.by_bibcode = {doc["bibcode"]: doc for doc in self.docs}
+        self.by_id = {paper.bibcode: paper for paper in papers}
+        self.recids: dict[str, str] = {}
+        for paper in papers:
+            if not paper.inspire_recid:
+                continue
+            if paper.arxiv_id:
+                self.recids[arxiv_key(paper.arxiv_id)] = paper.inspire_recid
+            if paper.doi:
+                self.recids[doi_key(paper.doi)] = paper.inspire_recid
+
+
+class FaultInjector:
+    """Per-request latency, random 5xx errors and a per-route requests/second limit."""
+
+    def __init__(self, latency_ms: float, jitter_ms: float, error_rate: float, rate_limit: float, seed: int) -> None:
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.recent: dict[str, deque[float]] = {}
+
+    def delay(self) -> float:
+        with self.lock:
+            return max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+
+    def fail(self) -> bool:
+        with self.lock:
+            return self.random.random() < self.error_rate
+
+    def admit(self, route: str) -> tuple[bool, int, float]:
+        """Return ``(allowed, remaining, reset_seconds)`` for a sliding one-second window."""
+        if self.rate_limit <= 0:
+            return True, 1_000_000, 0.0
+        now = time.monotonic()
+        with self.lock:
+            window = self.recent.setdefault(route, deque())
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            reset = 1.0 - (now - window[0]) if window else 0.0
+            if len(window) >= self.rate_limit:
+                return False, 0, reset
+            window.append(now)
+            return True, int(self.rate_limit) - len(window), reset
+
+
+def _ads_search(fixture: Fixture, params: dict[str, str]) -> dict:
+    query = params.get("q", "")
+    bibcodes = re.findall(r'bibcode:"([^"]+)"', query)
+    if bibcodes:
+        docs = [fixture.by_bibcode[b] for b in bibcodes if b in fixture.by_bibcode]
+        return {"response": {"numFound": len(docs), "docs": docs}}
+
+    docs = fixture.docs
+    since = re.search(r'(?:entry_date|indexstamp):\["([^"]+)" TO \*\]', query)
+    if since:
+        docs = [doc for doc in docs if doc["entry_date"] >= since.group(1)]
+    rows = int(params.get("rows") or 10)
+    cursor = params.get("cursorMark") or "*"
+    offset = 0 if cursor == "*" else int(cursor)
+    page = docs[offset : offset + rows]
+    next_cursor = str(offset + len(page)) if page else cursor
+    return {"response": {"numFound": len(docs), "docs": page}, "nextCursorMark": next_cursor}
+
+
+def _ads_bigquery(fixture: Fixture, body: str) -> dict:
+    bibcodes = [line.strip() for line in body.splitlines()[1:] if line.strip()]
+    docs = [
+        {"bibcode": b, "abstract": fixture.by_bibcode[b].get("abstract")}
+        for b in bibcodes
+        if b in fixture.by_bibcode
+    ]
+    return {"response": {"numFound": len(docs), "docs": docs}}
+
+
+def _inspire_search(fixture: Fixture, params: dict[str, str]) -> dict:
+    hits = []
+    seen: set[str] = set()
+    for kind, value in re.findall(r'(arxiv|doi):"?([^"\s]+)"?', params.get("q", ""), flags=re.IGNORECASE):
+        key = arxiv_key(value) if kind.lower() == "arxiv" else doi_key(value)
+        recid = fixture.recids.get(key)
+        if not recid or recid in seen:
+            continue
+        seen.add(recid)
+        metadata: dict = {"control_number": int(recid)}
+        if kind.lower() == "arxiv":
+            metadata["arxiv_eprints"] = [{"value": value}]
+        else:
+            metadata["dois"] = [{"value": value}]
+        hits.append({"metadata": metadata})
+    return {"hits": {"total": len(hits), "hits": hits}}
+
+
+def _openai_response(fixture: Fixture, body: dict) -> dict:
+    prompt = body["input"][-1]["content"][0]["text"]
+    schema = body["text"]["format"]["schema"]
+    allowed = set(schema["properties"]["results"]["items"]["properties"]["topics"]["items"]["enum"])
+    results = []
+    for paper_id in re.findall(r"^Paper id: (\S+)$", prompt, flags=re.MULTILINE):
+        paper = fixture.by_id.get(paper_id)
+        topics = [t for t in (paper.topics if paper else []) if t in allowed]
+        results.append({"id": paper_id, "topics": topics, "confidence": 0.9})
+    return {"output_text": json.dumps({"results": results})}
+
+
+def make_handler(fixture: Fixture, faults: FaultInjector, stats: Counter) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+        def setup(self) -> None:
+            super().setup()
+            stats["connections"] += 1
+
+        def _send(self, status: int, payload: dict, headers: dict[str, str] | None = None) -> None:
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                data = gzip.compress(data)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _handle(self, method: str) -> None:
+            parts = urllib.parse.urlsplit(self.path)
+            params = dict(urllib.parse.parse_qsl(parts.query))
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length).decode("utf-8") if length else ""
+            route = f"{method} {parts.path}"
+
+            if parts.path == "/_stats":
+                self._send(200, dict(stats))
+                return
+
+            time.sleep(faults.delay())
+            allowed, remaining, reset = faults.admit(route)
+            limit_headers = {
+                "X-RateLimit-Limit": str(int(faults.rate_limit) if faults.rate_limit > 0 else 5000),
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(int(time.time() + reset) + 1),
+            }
+            if not allowed:
+                stats[f"{route} 429"] += 1
+                self._send(429, {"error": "rate limited"}, {**limit_headers, "Retry-After": str(max(1, round(reset)))})
+                return
+            if faults.fail():
+                stats[f"{route} 503"] += 1
+                self._send(503, {"error": "injected failure"})
+                return
+
+            if parts.path.endswith("/search/query") and method == "GET":
+                payload = _ads_search(fixture, params)
+            elif parts.path.endswith("/search/bigquery") and method == "POST":
+                payload = _ads_bigquery(fixture, body)
+            elif parts.path.endswith("/literature") and method == "GET":
+                payload = _inspire_search(fixture, params)
+            elif parts.path.endswith("/responses") and method == "POST":
+                payload = _openai_response(fixture, json.loads(body))
+            else:
+                stats[f"{route} 404"] += 1
+                self._send(404, {"error": f"unknown route {route}"})
+                return
+            stats[f"{route} 200"] += 1
+            self._send(200, payload, limit_headers)
+
+        def do_GET(self) -> None:
+            self._handle("GET")
+
+        def do_POST(self) -> None:
+            self._handle("POST")
+
+    return Handler
+
+
+def env_exports(base: str) -> list[str]:
+    return [
+        f"export ADS_API_BASE_URL={base}/v1",
+        f"export INSPIRE_API_BASE_URL={base}/api",
+        f"export OPENAI_BASE_URL={base}/v1",
+        "export ADS_API_TOKEN=${ADS_API_TOKEN:-fake-ads-token}",
+        "export OPENAI_API_KEY=${OPENAI_API_KEY:-fake-openai-key}",
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE, help="Stored ADS JSON to replay.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per request.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter on the latency.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503.")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Requests/second per route before 429s.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--print-env", action="store_true", help="Print shell exports pointing the sync here and exit.")
+    args = parser.parse_args()
+
+    base = f"http://{args.host}:{args.port}"
+    if args.print_env:
+        print("\n".join(env_exports(base)))
+        return 0
+
+    fixture = Fixture(read_papers_json(Path(args.fixture)))
+    faults = FaultInjector(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit, args.seed)
+    stats: Counter = Counter()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(fixture, faults, stats))
+    print(f"Serving {len(fixture.docs)} recorded papers on {base} (Ctrl-C to stop)", flush=True)
+
+    def stop(signum: int, frame: object) -> None:
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for route, count in sorted(stats.items()):
+            print(f"{count:6d}  {route}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
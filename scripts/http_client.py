@@ -0,0 +1,221 @@
+"""Shared HTTP client for the ADS, INSPIRE and OpenAI calls.
+
+Connections are kept alive in per-host pools, responses are requested gzip
+encoded, and every call follows one timeout/retry policy: 429s, 5xx and
+connection errors are retried with jittered exponential backoff, honouring
+``Retry-After`` and pausing a host when ``X-RateLimit-Remaining`` hits zero
+until ``X-RateLimit-Reset``. Each attempt is recorded as an ``http`` tracing span.
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import io
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+from email.message import Message
+
+from tracing import span
+
+USER_AGENT = "ads-data-sync-script"
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+MAX_IDLE_PER_HOST = 8
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Errors from a keep-alive connection the server has already dropped.
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+def retry_delay(
+    status: int | None,
+    headers: Message | None,
+    attempt: int,
+    base: float = DEFAULT_BACKOFF,
+    cap: float = MAX_BACKOFF,
+) -> float | None:
+    """Seconds to wait before retrying, or None if the failure is not retryable.
+
+    ``status`` is None for connection errors and timeouts.
+    """
+    if status is not None and status not in RETRY_STATUSES:
+        return None
+    if headers is not None:
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(cap, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        if status == 429 and headers.get("X-RateLimit-Remaining") == "0":
+            reset = _reset_time(headers)
+            if reset is not None:
+                return min(cap, max(0.0, reset - time.time()))
+    return min(cap, base * (2**attempt)) * (0.5 + random.random() / 2)
+
+
+def _reset_time(headers: Message) -> float | None:
+    """``X-RateLimit-Reset`` as an epoch time (ADS sends epoch seconds, others a delta)."""
+    try:
+        value = float(headers.get("X-RateLimit-Reset") or "")
+    except ValueError:
+        return None
+    return value if value > 1e9 else time.time() + value
+
+
+class HttpClient:
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        max_idle_per_host: int = MAX_IDLE_PER_HOST,
+    ) -> None:
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_idle_per_host = max_idle_per_host
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._paused_until: dict[str, float] = {}
+
+    def _acquire(self, scheme: str, netloc: str, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return factory(netloc, timeout=timeout), False
+
+    def _release(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    def _wait_for_host(self, netloc: str) -> None:
+        with self._lock:
+            until = self._paused_until.get(netloc, 0.0)
+        delay = until - time.time()
+        if delay > 0:
+            time.sleep(min(delay, MAX_BACKOFF))
+
+    def _note_rate_limit(self, netloc: str, headers: Message) -> None:
+        if headers.get("X-RateLimit-Remaining") != "0":
+            return
+        reset = _reset_time(headers)
+        if reset is not None:
+            with self._lock:
+                self._paused_until[netloc] = max(self._paused_until.get(netloc, 0.0), reset)
+
+    def _send_once(
+        self,
+        method: str,
+        url: str,
+        data: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+        attempt: int,
+    ) -> tuple[int, str, Message, bytes]:
+        """Send one request over a pooled connection; return ``(status, reason, headers, body)``.
+
+        A request that fails on a reused connection is resent once on a fresh one.
+        """
+        parts = urllib.parse.urlsplit(url)
+        target = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        # Attempt 0 leaves ``retry`` unset so an enclosing span's value is inherited.
+        extra = {"retry": attempt} if attempt else {}
+        with span(f"{method} {parts.netloc}{parts.path}", "http", host=parts.netloc, **extra) as attrs:
+            while True:
+                conn, reused = self._acquire(parts.scheme, parts.netloc, timeout)
+                try:
+                    conn.request(method, target, body=data, headers=headers)
+                    resp = conn.getresponse()
+                    raw = resp.read()
+                except STALE_CONNECTION_ERRORS:
+                    conn.close()
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+                break
+            attrs["status"] = resp.status
+            if resp.status >= 400:
+                attrs["error"] = f"HTTP {resp.status}"
+            attrs["bytes"] = len(raw)
+            attrs["reused"] = reused
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(parts.scheme, parts.netloc, conn)
+            if (resp.getheader("Content-Encoding") or "").lower() == "gzip":
+                raw = gzip.decompress(raw)
+                attrs["gzip"] = True
+            return resp.status, resp.reason, resp.msg, raw
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        retries: int | None = None,
+    ) -> bytes:
+        """Return the decoded response body, retrying per the client's policy.
+
+        Raises ``urllib.error.HTTPError`` for a final non-2xx status; the last
+        connection error or timeout is re-raised as is.
+        """
+        netloc = urllib.parse.urlsplit(url).netloc
+        send_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip", **(headers or {})}
+        retries = self.retries if retries is None else retries
+        for attempt in range(retries + 1):
+            self._wait_for_host(netloc)
+            try:
+                status, reason, resp_headers, body = self._send_once(
+                    method, url, data, send_headers, timeout or self.timeout, attempt
+                )
+            except (OSError, http.client.HTTPException):
+                if attempt == retries:
+                    raise
+                time.sleep(retry_delay(None, None, attempt, self.backoff))
+                continue
+            self._note_rate_limit(netloc, resp_headers)
+            if 200 <= status < 300:
+                return body
+            delay = retry_delay(status, resp_headers, attempt, self.backoff)
+            if attempt == retries or delay is None:
+                raise urllib.error.HTTPError(url, status, reason, resp_headers, io.BytesIO(body))
+            time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    def get(self, url: str, **kwargs) -> bytes:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, data: bytes, **kwargs) -> bytes:
+        return self.request("POST", url, data=data, **kwargs)
+
+
+CLIENT = HttpClient()
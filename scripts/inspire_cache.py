@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Persistent INSPIRE record-id cache keyed by normalized arXiv id / DOI.
+
+Resolved record ids never expire; misses are retried once they are older than
+the miss TTL.
+
+Usage:
+  python scripts/inspire_cache.py --stats
+  python scripts/inspire_cache.py --list
+  python scripts/inspire_cache.py --prune
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from datetime import date, timedelta
+from pathlib import Path
+
+from outputs import write_json_if_changed
+
+DEFAULT_CACHE_JSON = "data/inspire_cache.json"
+DEFAULT_MISS_TTL_DAYS = 30
+
+
+def arxiv_key(arxiv_id: str) -> str:
+    cleaned = re.sub(r"(?i)^arxiv:", "", arxiv_id.strip()).lower()
+    return "arxiv:" + re.sub(r"v\d+$", "", cleaned)
+
+
+def doi_key(doi: str) -> str:
+    return "doi:" + doi.strip().lower()
+
+
+def identifier_keys(arxiv_id: str | None, doi: str | None) -> list[str]:
+    keys: list[str] = []
+    if arxiv_id and arxiv_id.strip():
+        keys.append(arxiv_key(arxiv_id))
+    if doi and doi.strip():
+        keys.append(doi_key(doi))
+    return keys
+
+
+class InspireCache:
+    def __init__(
+        self,
+        path: Path,
+        entries: dict[str, dict] | None = None,
+        miss_ttl_days: int = DEFAULT_MISS_TTL_DAYS,
+        today: date | None = None,
+    ) -> None:
+        self.path = path
+        self.entries: dict[str, dict] = entries or {}
+        self.miss_ttl_days = miss_ttl_days
+        self.today = today or date.today()
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path, miss_ttl_days: int = DEFAULT_MISS_TTL_DAYS) -> "InspireCache":
+        entries: dict[str, dict] = {}
+        if path.exists():
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            raw = payload.get("entries") or {}
+            entries = {str(key): value for key, value in raw.items() if isinstance(value, dict)}
+        return cls(path, entries, miss_ttl_days=miss_ttl_days)
+
+    def is_expired(self, entry: dict) -> bool:
+        if entry.get("recid"):
+            return False
+        try:
+            checked = date.fromisoformat(str(entry.get("checked") or ""))
+        except ValueError:
+            return True
+        return self.today - checked > timedelta(days=self.miss_ttl_days)
+
+    def resolve(self, arxiv_id: str | None, doi: str | None) -> tuple[bool, str | None]:
+        """Return ``(settled, recid)`` for an identifier pair.
+
+        A pair is settled when any of its keys has a cached record id, or when
+        every key has an unexpired cached miss.
+        """
+        keys = identifier_keys(arxiv_id, doi)
+        if not keys:
+            return True, None
+        all_missed = True
+        for key in keys:
+            entry = self.entries.get(key)
+            if entry and entry.get("recid"):
+                return True, str(entry["recid"])
+            if entry is None or self.is_expired(entry):
+                all_missed = False
+        return all_missed, None
+
+    def store(self, arxiv_id: str | None, doi: str | None, recid: str | None) -> None:
+        for key in identifier_keys(arxiv_id, doi):
+            entry = {"recid": recid, "checked": self.today.isoformat()}
+            if self.entries.get(key) != entry:
+                self.entries[key] = entry
+                self.dirty = True
+
+    def seed(self, arxiv_id: str | None, doi: str | None, recid: str | None) -> None:
+        """Record a known record id without overwriting existing entries."""
+        if not recid:
+            return
+        for key in identifier_keys(arxiv_id, doi):
+            if key not in self.entries:
+                self.entries[key] = {"recid": recid, "checked": self.today.isoformat()}
+                self.dirty = True
+
+    def prune(self) -> int:
+        expired = [key for key, entry in self.entries.items() if self.is_expired(entry)]
+        for key in expired:
+            del self.entries[key]
+        if expired:
+            self.dirty = True
+        return len(expired)
+
+    def stats(self) -> dict[str, int]:
+        hits = sum(1 for entry in self.entries.values() if entry.get("recid"))
+        expired = sum(1 for entry in self.entries.values() if self.is_expired(entry))
+        return {
+            "entries": len(self.entries),
+            "hits": hits,
+            "misses": len(self.entries) - hits,
+            "expired_misses": expired,
+        }
+
+    def save(self) -> None:
+        if not self.dirty and self.path.exists():
+            return
+        payload = {
+            "schema_version": 1,
+            "entries": {key: self.entries[key] for key in sorted(self.entries)},
+        }
+        write_json_if_changed(self.path, payload)
+        self.dirty = False
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cache", default=DEFAULT_CACHE_JSON)
+    parser.add_argument("--miss-ttl-days", type=int, default=DEFAULT_MISS_TTL_DAYS)
+    parser.add_argument("--stats", action="store_true", help="Print entry counts.")
+    parser.add_argument("--list", action="store_true", help="Print every cached entry.")
+    parser.add_argument("--prune", action="store_true", help="Drop expired misses and save.")
+    args = parser.parse_args()
+
+    cache = InspireCache.load(Path(args.cache), miss_ttl_days=args.miss_ttl_days)
+    if args.list:
+        for key in sorted(cache.entries):
+            entry = cache.entries[key]
+            state = "expired" if cache.is_expired(entry) else ("hit" if entry.get("recid") else "miss")
+            print(f"{key}\t{entry.get('recid') or '-'}\t{entry.get('checked') or '-'}\t{state}")
+    if args.prune:
+        removed = cache.prune()
+        cache.save()
+        print(f"Pruned {removed} expired misses from {args.cache}")
+    if args.stats or not (args.list or args.prune):
+        stats = cache.stats()
+        print(
+            f"Entries: {stats['entries']} (hits={stats['hits']}, misses={stats['misses']}, "
+            f"expired_misses={stats['expired_misses']})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,292 @@
+"""Fuzzy near-duplicate detection for ADS records (MinHash + LSH).
+
+Catches what exact identity matching misses: a retitled journal version and its
+eprint record when they share no identifier, or two records of one article in
+the same journal.
+
+Each title becomes a set of word unigram/bigram shingles, sketched with
+one-permutation MinHash (one hash per shingle, densified by rotation), and the
+sketch is split into LSH bands. Only records sharing a band bucket are compared,
+so the pass is near-linear in the number of records; oversized buckets (stock
+titles) are skipped. Candidates are confirmed on exact title Jaccard, author
+overlap and a year gap under MAX_YEAR_GAP, and need a second signal: an
+eprint/article pair or the same journal. They are never merged when their arXiv
+ids, journal DOIs, article volume/page or series tokens ("II", "O3a", "GWTC-2")
+differ.
+
+Authors are a verification signal rather than part of the sketch: stored
+collaboration papers keep only their first names (see ads_data.write_papers_json),
+so a truncated and a full list would look disjoint to a Jaccard estimate, while
+the overlap coefficient used here still matches them.
+
+Usage:
+  python scripts/near_duplicates.py data/ads_publications.json
+  python scripts/near_duplicates.py --self-check
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import unicodedata
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterable, Protocol
+
+NUM_BUCKETS = 32
+BAND_ROWS = 4
+MAX_BUCKET_SIZE = 50
+TITLE_THRESHOLD = 0.6
+AUTHOR_THRESHOLD = 0.7
+MAX_YEAR_GAP = 3  # exclusive: records must be fewer than this many years apart
+ARXIV_DOI_PREFIX = "10.48550/"
+
+_EMPTY = 1 << 64
+_STOPWORDS = frozenset("a an and as at by for from in into of on or the to with via using".split())
+# Tokens naming one entry of a series: numbers, roman numerals, and identifiers
+# with a digit such as observing runs ("o3a") or catalog versions ("gwtc", "2").
+_SERIES_RE = re.compile(r"^(?:\w*\d\w*|i|ii|iii|iv|vi|vii|viii|ix|x|first|second|third|fourth|fifth)$")
+
+
+class _Record(Protocol):
+    title: str
+    authors: list[str]
+    year: int
+    doctype: str
+    pub: str
+    volume: str
+    page: str
+    arxiv_id: str | None
+    doi: str | None
+
+
+def _fold(text: str) -> str:
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+
+
+def title_tokens(title: str) -> list[str]:
+    return [token for token in re.split(r"\W+", _fold(title)) if token and token not in _STOPWORDS]
+
+
+def title_shingles(title: str) -> frozenset[str]:
+    tokens = title_tokens(title)
+    return frozenset(tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])])
+
+
+def author_keys(authors: Iterable[str]) -> frozenset[str]:
+    """``last|first-initial`` keys, so "Venumadhav, T." and "Venumadhav, Tejaswi" match."""
+    keys = set()
+    for name in authors:
+        last, _, first = _fold(name).partition(",")
+        last = re.sub(r"\W+", "", last)
+        initial = re.sub(r"\W+", "", first)[:1]
+        if last:
+            keys.add(f"{last}|{initial}")
+    return frozenset(keys)
+
+
+def _hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def minhash(shingles: Iterable[str], num_buckets: int = NUM_BUCKETS) -> tuple[int, ...]:
+    """One-permutation MinHash: the minimum hash per bucket, empty buckets borrowing from the next."""
+    mins = [_EMPTY] * num_buckets
+    for shingle in shingles:
+        value = _hash(shingle)
+        bucket = value % num_buckets
+        if value < mins[bucket]:
+            mins[bucket] = value
+    if all(value == _EMPTY for value in mins):
+        return ()
+    out = list(mins)
+    for i in range(num_buckets):
+        if mins[i] == _EMPTY:
+            j, distance = i, 0
+            while mins[j] == _EMPTY:
+                j = (j + 1) % num_buckets
+                distance += 1
+            out[i] = mins[j] + distance * _EMPTY
+    return tuple(out)
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def overlap(a: frozenset[str], b: frozenset[str]) -> float:
+    return len(a & b) / min(len(a), len(b)) if a and b else 0.0
+
+
+def candidate_pairs(signatures: list[tuple[int, ...]], rows: int = BAND_ROWS) -> set[tuple[int, int]]:
+    buckets: dict[tuple, list[int]] = {}
+    for index, signature in enumerate(signatures):
+        for start in range(0, len(signature) - rows + 1, rows):
+            buckets.setdefault((start, signature[start : start + rows]), []).append(index)
+    pairs: set[tuple[int, int]] = set()
+    for members in buckets.values():
+        if 1 < len(members) <= MAX_BUCKET_SIZE:
+            for i, a in enumerate(members):
+                for b in members[i + 1 :]:
+                    pairs.add((a, b))
+    return pairs
+
+
+def _versionless(arxiv_id: str | None) -> str | None:
+    return re.sub(r"v\d+$", "", arxiv_id.strip().lower()) if arxiv_id and arxiv_id.strip() else None
+
+
+def _journal_doi(doi: str | None) -> str | None:
+    """The DOI unless it is an arXiv DOI, which the arXiv id check already covers."""
+    doi = (doi or "").strip().lower()
+    return doi if doi and not doi.startswith(ARXIV_DOI_PREFIX) else None
+
+
+def _differ(a: object, b: object) -> bool:
+    return bool(a) and bool(b) and a != b
+
+
+def distinct_records(left: _Record, right: _Record) -> bool:
+    """True when hard evidence says the two records are different papers."""
+    if _differ(_versionless(left.arxiv_id), _versionless(right.arxiv_id)):
+        return True
+    if _differ(_journal_doi(left.doi), _journal_doi(right.doi)):
+        return True
+    if left.doctype == right.doctype == "article" and left.volume and left.page and right.volume and right.page:
+        if (left.volume.strip(), left.page.strip()) != (right.volume.strip(), right.page.strip()):
+            return True
+    series_left = {t for t in title_tokens(left.title) if _SERIES_RE.match(t)}
+    series_right = {t for t in title_tokens(right.title) if _SERIES_RE.match(t)}
+    return series_left != series_right
+
+
+def same_publication(left: _Record, right: _Record) -> bool:
+    """The second signal a title/author match needs: an eprint/article pair or the same journal."""
+    if {left.doctype, right.doctype} == {"eprint", "article"}:
+        return True
+    return bool(left.pub) and " ".join(_fold(left.pub).split()) == " ".join(_fold(right.pub).split())
+
+
+def near_duplicate_groups(records: list[_Record]) -> list[list[int]]:
+    """Return groups (indices into ``records``, two or more each) of near-duplicate records."""
+    shingles = [title_shingles(record.title) for record in records]
+    pairs = candidate_pairs([minhash(s) for s in shingles])
+
+    authors: dict[int, frozenset[str]] = {}
+    parent = list(range(len(records)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for a, b in pairs:
+        left, right = records[a], records[b]
+        if abs(left.year - right.year) >= MAX_YEAR_GAP or jaccard(shingles[a], shingles[b]) < TITLE_THRESHOLD:
+            continue
+        if distinct_records(left, right) or not same_publication(left, right):
+            continue
+        for i in (a, b):
+            if i not in authors:
+                authors[i] = author_keys(records[i].authors)
+        if overlap(authors[a], authors[b]) < AUTHOR_THRESHOLD:
+            continue
+        parent[find(a)] = find(b)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(len(records)):
+        groups.setdefault(find(i), []).append(i)
+    return [members for members in groups.values() if len(members) > 1]
+
+
+def _example(title: str, year: int, doctype: str, pub: str, volume: str = "", page: str = "", **ids) -> SimpleNamespace:
+    authors = ["Olsen, Seth", "Venumadhav, Tejaswi", "Mushkin, Jonathan", "Zackay, Barak"]
+    return SimpleNamespace(
+        title=title,
+        authors=authors,
+        year=year,
+        doctype=doctype,
+        pub=pub,
+        volume=volume,
+        page=page,
+        arxiv_id=ids.get("arxiv_id"),
+        doi=ids.get("doi"),
+    )
+
+
+# (description, left, right, should_merge)
+REGRESSION_CASES = [
+    (
+        "numbered observing runs (O3a vs O3b, stored records without arXiv ids)",
+        _example("New binary black hole mergers in the LIGO-Virgo O3a data", 2022, "article", "Physical Review D",
+                 "106", "043009", doi="10.48550/arXiv.2201.02252"),
+        _example("New binary black hole mergers in the LIGO-Virgo O3b data", 2025, "article", "Physical Review D",
+                 "111", "024049", doi="10.1103/PhysRevD.111.024049"),
+        False,
+    ),
+    (
+        "numbered observing runs, same year and no volume/page",
+        _example("New binary black hole mergers in the LIGO-Virgo O3a data", 2023, "eprint", "arXiv e-prints"),
+        _example("New binary black hole mergers in the LIGO-Virgo O3b data", 2023, "article", "Physical Review D"),
+        False,
+    ),
+    (
+        "numbered catalog versions",
+        _example("GWTC-2: compact binary coalescences observed in the first half of the third observing run",
+                 2021, "article", "Physical Review X", "11", "021053"),
+        _example("GWTC-3: compact binary coalescences observed in the second half of the third observing run",
+                 2021, "article", "Physical Review X", "13", "041039"),
+        False,
+    ),
+    (
+        "same journal, different journal DOIs",
+        _example("Searching for binary black hole mergers in public gravitational wave data", 2020,
+                 "article", "Physical Review D", doi="10.1103/PhysRevD.101.083030"),
+        _example("Searching for binary black hole mergers in the public gravitational wave data", 2020,
+                 "article", "Physical Review D", doi="10.1103/PhysRevD.100.023011"),
+        False,
+    ),
+    (
+        "retitled journal version of an eprint",
+        _example("A new search pipeline for compact binary mergers: results for binary black holes", 2019,
+                 "eprint", "arXiv e-prints"),
+        _example("New search pipeline for compact binary mergers: results for binary black holes", 2020,
+                 "article", "Physical Review D", "101", "083030"),
+        True,
+    ),
+]
+
+
+def self_check() -> int:
+    failures = 0
+    for description, left, right, should_merge in REGRESSION_CASES:
+        merged = bool(near_duplicate_groups([left, right]))
+        if merged != should_merge:
+            failures += 1
+            print(f"FAIL {description}: {'merged' if merged else 'kept apart'}")
+    print(f"{len(REGRESSION_CASES) - failures}/{len(REGRESSION_CASES)} near-duplicate regression cases pass")
+    return 1 if failures else 0
+
+
+def main() -> int:
+    from ads_data import read_papers_json
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("ads_json", nargs="?", default="data/ads_publications.json")
+    parser.add_argument("--self-check", action="store_true", help="Run the built-in regression cases.")
+    args = parser.parse_args()
+    if args.self_check:
+        return self_check()
+
+    papers = read_papers_json(Path(args.ads_json))
+    groups = near_duplicate_groups(papers)
+    for members in groups:
+        print("\n".join(f"  {papers[i].bibcode}  {papers[i].title}" for i in members) + "\n")
+    print(f"{len(groups)} near-duplicate group(s) among {len(papers)} papers")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Stable paper identities shared by dedupe, topic overrides and enrichment merges.
+
+Every known alias of a paper (bibcode, versionless arXiv id, DOI, INSPIRE record
+id, or a squashed title when there is no arXiv id) maps to one stable paper id.
+A record is therefore still recognised after ADS swaps an eprint bibcode for the
+journal bibcode, and its stored abstract and topics carry over.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Protocol
+
+from inspire_cache import arxiv_key, doi_key
+
+
+class _Identified(Protocol):
+    title: str
+    bibcode: str
+    arxiv_id: str | None
+    doi: str | None
+    inspire_recid: str | None
+    paper_id: str | None
+
+
+def bibcode_key(bibcode: str) -> str:
+    return "bibcode:" + bibcode.strip()
+
+
+def inspire_key(recid: str) -> str:
+    return "inspire:" + str(recid).strip()
+
+
+def title_key(title: str) -> str:
+    return "title:" + re.sub(r"\W+", "", title.lower())
+
+
+def identity_aliases(
+    bibcode: str | None,
+    arxiv_id: str | None,
+    doi: str | None,
+    inspire_recid: str | None,
+    title: str | None,
+) -> list[str]:
+    """Return the alias keys of a paper, most stable first (the first one names new papers)."""
+    aliases: list[str] = []
+    if arxiv_id and arxiv_id.strip():
+        aliases.append(arxiv_key(arxiv_id))
+    if doi and doi.strip():
+        aliases.append(doi_key(doi))
+    if bibcode and bibcode.strip():
+        aliases.append(bibcode_key(bibcode))
+    if inspire_recid and str(inspire_recid).strip():
+        aliases.append(inspire_key(inspire_recid))
+    if not (arxiv_id and arxiv_id.strip()) and title and title.strip():
+        aliases.append(title_key(title))
+    return aliases
+
+
+def paper_aliases(paper: _Identified) -> list[str]:
+    return identity_aliases(paper.bibcode, paper.arxiv_id, paper.doi, paper.inspire_recid, paper.title)
+
+
+class IdentityIndex:
+    """Alias -> paper id map; papers sharing any alias get the same id."""
+
+    def __init__(self) -> None:
+        self.ids: dict[str, str] = {}
+        self.aliases: dict[str, list[str]] = {}
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[_Identified]) -> "IdentityIndex":
+        index = cls()
+        for paper in papers:
+            paper.paper_id = index.add(paper_aliases(paper), paper.paper_id)[0]
+        return index
+
+    def resolve(self, aliases: Iterable[str]) -> str | None:
+        for alias in aliases:
+            paper_id = self.ids.get(alias)
+            if paper_id is not None:
+                return paper_id
+        return None
+
+    def add(self, aliases: list[str], paper_id: str | None = None) -> tuple[str, list[str]]:
+        """Register ``aliases`` and return ``(paper_id, merged_ids)``.
+
+        The id is ``paper_id`` if given, else the id of the first known alias,
+        else the first alias itself. When the aliases bridge several known
+        papers, those are folded into the returned id and listed in ``merged_ids``.
+        """
+        known = list(dict.fromkeys(self.ids[alias] for alias in aliases if alias in self.ids))
+        target = paper_id or (known[0] if known else aliases[0])
+        merged = [other for other in known if other != target]
+        group = self.aliases.setdefault(target, [])
+        for other in merged:
+            for alias in self.aliases.pop(other, []):
+                self.ids[alias] = target
+                group.append(alias)
+        for alias in aliases:
+            if self.ids.get(alias) != target:
+                self.ids[alias] = target
+                group.append(alias)
+        return target, merged
+
+    def assign(self, papers: Iterable[_Identified]) -> None:
+        """Set ``paper_id`` on each paper, reusing the id of any known alias."""
+        for paper in papers:
+            aliases = paper_aliases(paper)
+            paper.paper_id = self.add(aliases, paper.paper_id or self.resolve(aliases))[0]
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""Run the ADS-backed site generators in a single process.
+
+Each input (ADS JSON, topics, CV profile, CV source) is read once and shared by
+every stage; per-stage timings are printed at the end. Stages whose input files
+(data and generator code) and outputs match the hashes recorded in the stamp
+file after their last run are skipped.
+
+Usage:
+  python scripts/pipeline.py
+  python scripts/pipeline.py --sync-ads
+  python scripts/pipeline.py --sync-ads -- --full-resync --skip-topics
+  python scripts/pipeline.py --explain
+  python scripts/pipeline.py --force --only cv
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import sync_compact_cv
+import sync_cv
+import sync_group
+import sync_publications
+import sync_publist
+from ads_data import AdsPaper, read_papers_json
+from build_stamps import DEFAULT_STAMPS_JSON, BuildStamps
+from cv_profile import DEFAULT_PROFILE_JSON, read_cv_profile
+from tracing import export_trace, span
+
+STAGES = ("publications", "cv", "compact_cv", "publist", "group")
+# Relative to the working directory so stamps match across checkouts.
+SCRIPTS_DIR = Path(os.path.relpath(Path(__file__).parent))
+
+
+@dataclass
+class PipelineInputs:
+    papers: list[AdsPaper]
+    topics: list[str]
+    profile: dict[str, Any]
+    cv_source: str
+
+
+def load_inputs(args: argparse.Namespace) -> PipelineInputs:
+    ads_json_path = Path(args.ads_json)
+    if not ads_json_path.exists():
+        raise SystemExit(f"Missing ADS data file: {ads_json_path}. Run python scripts/sync_ads_data.py first.")
+    return PipelineInputs(
+        papers=read_papers_json(ads_json_path),
+        topics=sync_publications.load_topics(Path(args.topics_file)),
+        profile=read_cv_profile(args.profile),
+        cv_source=Path(args.cv_source).read_text(encoding="utf-8"),
+    )
+
+
+def _describe(counts: dict[str, int]) -> tuple[str, bool]:
+    return ", ".join(f"{key}={value}" for key, value in counts.items()), counts.get("changed", 0) > 0
+
+
+def stage_runners(args: argparse.Namespace, inputs: PipelineInputs) -> dict[str, Callable[[], tuple[str, bool]]]:
+    """Return a runner per stage yielding ``(detail, changed)``."""
+
+    def publications() -> tuple[str, bool]:
+        changed = sync_publications.generate(inputs.papers, inputs.topics, Path(args.publications_page))
+        return f"{'Updated' if changed else 'No changes in'} {args.publications_page}", changed
+
+    def cv() -> tuple[str, bool]:
+        return _describe(sync_cv.generate(
+            inputs.papers,
+            inputs.cv_source,
+            inputs.profile,
+            Path(args.cv_private),
+            Path(args.cv_public),
+        ))
+
+    def compact_cv() -> tuple[str, bool]:
+        changed = sync_compact_cv.generate(inputs.papers, inputs.profile, Path(args.cv_compact))
+        return f"{'Wrote' if changed else 'No changes in'} {args.cv_compact}", changed
+
+    def publist() -> tuple[str, bool]:
+        return _describe(sync_publist.generate(inputs.papers, Path(args.publist)))
+
+    def group() -> tuple[str, bool]:
+        return _describe(sync_group.generate(
+            inputs.cv_source,
+            Path(args.group_page),
+            Path(args.group_profiles),
+            Path(args.collaborators),
+            args.placeholder,
+            inputs.topics,
+        ))
+
+    return {
+        "publications": publications,
+        "cv": cv,
+        "compact_cv": compact_cv,
+        "publist": publist,
+        "group": group,
+    }
+
+
+def local_imports(path: Path) -> list[str]:
+    """Names of the ``scripts/`` modules imported anywhere in ``path``."""
+    text = path.read_text(encoding="utf-8")
+    names = re.findall(r"^\s*(?:from|import)\s+(\w+)", text, re.MULTILINE)
+    return [name for name in dict.fromkeys(names) if (SCRIPTS_DIR / f"{name}.py").exists()]
+
+
+def stage_graph(args: argparse.Namespace) -> dict[str, tuple[list[Path], list[Path]]]:
+    """Return ``(inputs, outputs)`` per stage; inputs include the generator modules."""
+
+    def code(*names: str) -> list[Path]:
+        """The named modules plus every local module they import, transitively."""
+        seen: dict[str, None] = {}
+        pending = list(names)
+        while pending:
+            name = pending.pop(0)
+            if name not in seen:
+                seen[name] = None
+                pending.extend(local_imports(SCRIPTS_DIR / f"{name}.py"))
+        return [SCRIPTS_DIR / f"{name}.py" for name in seen]
+
+    ads_json = Path(args.ads_json)
+    topics = Path(args.topics_file)
+    profile = Path(args.profile)
+    cv_source = Path(args.cv_source)
+    return {
+        "publications": (
+            [ads_json, topics, *code("sync_publications")],
+            [Path(args.publications_page)],
+        ),
+        "cv": (
+            [ads_json, profile, cv_source, *code("sync_cv")],
+            [Path(args.cv_private), Path(args.cv_public)],
+        ),
+        "compact_cv": (
+            [ads_json, profile, *code("sync_compact_cv")],
+            [Path(args.cv_compact)],
+        ),
+        "publist": (
+            [ads_json, *code("sync_publist")],
+            [Path(args.publist)],
+        ),
+        "group": (
+            [
+                cv_source,
+                topics,
+                Path(args.group_profiles),
+                Path(args.collaborators),
+                *code("sync_group"),
+            ],
+            [Path(args.group_page)],
+        ),
+    }
+
+
+def print_timings(timings: list[tuple[str, float, str]]) -> None:
+    width = max(len(name) for name, _, _ in timings)
+    print("Stage timings:")
+    for name, seconds, detail in timings:
+        print(f"  {name:<{width}}  {seconds * 1000:8.1f} ms  {detail}")
+    print(f"  {'total':<{width}}  {sum(seconds for _, seconds, _ in timings) * 1000:8.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sync-ads", action="store_true", help="Run sync_ads_data.py first.")
+    parser.add_argument("--only", default=",".join(STAGES), help="Comma-separated subset of stages to run.")
+    parser.add_argument("--force", action="store_true", help="Run stages even when their inputs are unchanged.")
+    parser.add_argument("--explain", action="store_true", help="Print why each stage runs or is skipped.")
+    parser.add_argument("--stamps", default=DEFAULT_STAMPS_JSON, help="Input/output hash stamp file.")
+    parser.add_argument("--trace-out", default=None, help="Write a Chrome trace (JSON) of the run.")
+    parser.add_argument(
+        "--trace-summary",
+        default=None,
+        help="Append a Markdown timing table to this file (e.g. \"$GITHUB_STEP_SUMMARY\").",
+    )
+    parser.add_argument("--ads-json", default="data/ads_publications.json")
+    parser.add_argument("--topics-file", default="data/topics.json")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE_JSON)
+    parser.add_argument("--cv-source", default="cv/source/myresume_master.tex")
+    parser.add_argument("--publications-page", default=sync_publications.DEFAULT_PAGE)
+    parser.add_argument("--cv-private", default="private/cv/Tejaswi_CV_private.tex")
+    parser.add_argument("--cv-public", default="cv/generated/Tejaswi_CV_public.tex")
+    parser.add_argument("--cv-compact", default=sync_compact_cv.DEFAULT_OUT)
+    parser.add_argument("--publist", default=sync_publist.DEFAULT_OUT)
+    parser.add_argument("--group-page", default="05-index_group.md")
+    parser.add_argument("--group-profiles", default="data/group_profiles.json")
+    parser.add_argument("--collaborators", default="data/collaborators.json")
+    parser.add_argument("--placeholder", default="/assets/images/person-placeholder.svg")
+    parser.add_argument("sync_ads_args", nargs="*", help="Options for sync_ads_data.py, after a -- separator.")
+    args = parser.parse_args()
+    if args.sync_ads_args and not args.sync_ads:
+        parser.error("sync_ads_data.py options need --sync-ads")
+
+    selected = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in STAGES]
+    if unknown:
+        raise SystemExit(f"Unknown stage(s): {', '.join(unknown)}. Choose from: {', '.join(STAGES)}")
+
+    timings: list[tuple[str, float, str]] = []
+    if args.sync_ads:
+        import sync_ads_data
+
+        start = time.perf_counter()
+        with span("sync_ads"):
+            rc = sync_ads_data.main(args.sync_ads_args)
+        timings.append(("sync_ads", time.perf_counter() - start, f"exit={rc}"))
+        if rc != 0:
+            print_timings(timings)
+            export_trace(args.trace_out, args.trace_summary, title="Pipeline timing")
+            return rc
+
+    stamps = BuildStamps.load(Path(args.stamps))
+    graph = stage_graph(args)
+    pending: list[str] = []
+    changed: list[str] = []
+    for name in STAGES:
+        if name not in selected:
+            continue
+        reasons = ["--force"] if args.force else stamps.reasons(name, *graph[name])
+        if args.explain:
+            print(f"{name}: " + (f"run ({'; '.join(reasons)})" if reasons else "skip (inputs and outputs unchanged)"))
+        if reasons:
+            pending.append(name)
+        else:
+            timings.append((name, 0.0, "skipped (up to date)"))
+
+    if pending:
+        start = time.perf_counter()
+        with span("load"):
+            inputs = load_inputs(args)
+        timings.append(("load", time.perf_counter() - start, f"papers={len(inputs.papers)}"))
+
+        runners = stage_runners(args, inputs)
+        for name in pending:
+            start = time.perf_counter()
+            with span(name, "render") as stage_span:
+                detail, stage_changed = runners[name]()
+                stage_span["changed"] = stage_changed
+            timings.append((name, time.perf_counter() - start, detail))
+            stamps.record(name, *graph[name])
+            if stage_changed:
+                changed.append(name)
+        stamps.save()
+
+    print_timings(timings)
+    export_trace(args.trace_out, args.trace_summary, title="Pipeline timing")
+    print(f"Changed outputs: {', '.join(changed)}" if changed else "No generated files changed.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
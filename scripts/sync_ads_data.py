@@ -9,19 +9,62 @@ import json
 import os
 import re
 import sys
-import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from ads_data import (
+    COMPACT_AUTHORS_ABOVE,
+    DEFAULT_INSPIRE_WORKERS,
+    DEFAULT_PER_HOST_LIMIT,
+    DEFAULT_WATERMARK_FIELD,
+    INSPIRE_BATCH_SIZE,
+    NTH_AUTHOR_THRESHOLD,
+    WATERMARK_FIELDS,
     clean_and_dedupe,
     enrich_with_inspire,
     fetch_abstracts_for_bibcodes,
-    fetch_ads_docs,
+    fetch_citation_counts,
+    iter_ads_docs,
     load_dotenv,
     load_enrichment_map,
+    merge_papers,
+    patch_citation_counts,
+    read_papers_json,
+    read_sync_state,
     write_papers_json,
 )
+from http_client import CLIENT
+from inspire_cache import DEFAULT_CACHE_JSON, DEFAULT_MISS_TTL_DAYS, InspireCache, arxiv_key, doi_key
+from paper_identity import IdentityIndex, bibcode_key, paper_aliases
+from topic_cache import DEFAULT_CACHE_JSON as DEFAULT_TOPIC_CACHE_JSON
+from topic_cache import TopicCache, classification_key
+from topic_model import DEFAULT_THRESHOLD as DEFAULT_LOCAL_THRESHOLD
+from topic_model import TopicModel
+from tracing import export_trace, span
+
+
+OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
+OPENAI_RESPONSES_URL = f"{OPENAI_BASE_URL}/responses"
+DEFAULT_CLASSIFY_BATCH_SIZE = 8
+DEFAULT_CLASSIFY_WORKERS = 4
+DEFAULT_CLASSIFY_RETRIES = 4
+# Incremental runs fall back to a full resync once the last one is this old.
+DEFAULT_FULL_RESYNC_DAYS = 7
+
+# Ask for abstracts in the main query when more than this share is missing.
+ABSTRACTS_INLINE_FRACTION = 0.25
+
+
+def _track_docs(docs: Iterable[dict], stats: dict, watermark_field: str) -> Iterator[dict]:
+    """Pass docs through while counting them and advancing the watermark."""
+    for doc in docs:
+        stats["docs"] += 1
+        mark = doc.get(watermark_field)
+        if mark and (stats["watermark"] is None or str(mark) > stats["watermark"]):
+            stats["watermark"] = str(mark)
+        yield doc
 
 
 def load_topics(path: Path) -> list[str]:
@@ -41,30 +84,54 @@ def load_topics(path: Path) -> list[str]:
     return cleaned
 
 
+def load_topic_renames(path: Path) -> dict[str, str]:
+    """Read the optional ``renames`` map (old name -> new name) from the topics file."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    raw = payload.get("renames") or {}
+    if not isinstance(raw, dict):
+        return {}
+    return {str(old).strip(): str(new).strip() for old, new in raw.items() if str(old).strip() and str(new).strip()}
+
+
+def diff_topics(
+    old: list[str],
+    new: list[str],
+    renames: dict[str, str] | None = None,
+) -> tuple[dict[str, str], set[str], list[str]]:
+    """Split a topic-list edit into ``(renamed, removed, added)``.
+
+    Renames come from the explicit ``renames`` map or from case-only changes;
+    every other old topic missing from ``new`` counts as removed.
+    """
+    old_set, new_set = set(old), set(new)
+    new_by_lower = {topic.lower(): topic for topic in new}
+    renamed: dict[str, str] = {}
+    for topic in old:
+        if topic in new_set:
+            continue
+        target = (renames or {}).get(topic) or new_by_lower.get(topic.lower())
+        if target in new_set:
+            renamed[topic] = target
+    removed = {topic for topic in old if topic not in new_set and topic not in renamed}
+    rename_targets = set(renamed.values())
+    added = [topic for topic in new if topic not in old_set and topic not in rename_targets]
+    return renamed, removed, added
+
+
 def topics_version(topics: list[str]) -> str:
     normalized = json.dumps(topics, ensure_ascii=True, separators=(",", ":"))
     digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
     return digest[:16]
 
 
-def _normalize_arxiv_key(value: str) -> str:
-    cleaned = value.strip().lower()
-    cleaned = re.sub(r"^(?:arxiv:)", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"v\d+$", "", cleaned)
-    return cleaned
-
-
-def _normalize_doi_key(value: str) -> str:
-    return value.strip().lower()
-
-
-def _normalize_override_key(key: str) -> tuple[str, str] | None:
+def _normalize_override_key(key: str) -> str | None:
+    """Turn an override key (``arxiv:``, ``doi:``, ``bibcode:`` or a bare bibcode) into an identity alias."""
     raw = key.strip()
     if not raw:
         return None
 
     if ":" not in raw:
-        return ("bibcode", raw)
+        return bibcode_key(raw)
 
     prefix, value = raw.split(":", 1)
     prefix = prefix.strip().lower()
@@ -73,24 +140,22 @@ def _normalize_override_key(key: str) -> tuple[str, str] | None:
         return None
 
     if prefix == "bibcode":
-        return ("bibcode", value)
+        return bibcode_key(value)
     if prefix == "arxiv":
-        normalized = _normalize_arxiv_key(value)
-        return ("arxiv", normalized) if normalized else None
+        return arxiv_key(value)
     if prefix == "doi":
-        normalized = _normalize_doi_key(value)
-        return ("doi", normalized) if normalized else None
+        return doi_key(value)
 
     # Backward-compatible fallback for unprefixed bibcodes only.
-    return ("bibcode", raw)
+    return bibcode_key(raw)
 
 
-def load_overrides(path: Path) -> dict[tuple[str, str], list[str]]:
+def load_overrides(path: Path) -> dict[str, list[str]]:
     if not path.exists():
         return {}
     payload = json.loads(path.read_text(encoding="utf-8"))
     raw = payload.get("overrides") or {}
-    out: dict[tuple[str, str], list[str]] = {}
+    out: dict[str, list[str]] = {}
     for key, topics in raw.items():
         normalized_key = _normalize_override_key(str(key))
         if not normalized_key:
@@ -99,25 +164,11 @@ def load_overrides(path: Path) -> dict[tuple[str, str], list[str]]:
     return out
 
 
-def _paper_override_keys(paper) -> list[tuple[str, str]]:
-    keys: list[tuple[str, str]] = []
-    if paper.bibcode:
-        keys.append(("bibcode", paper.bibcode))
-    if paper.doi:
-        normalized_doi = _normalize_doi_key(paper.doi)
-        if normalized_doi:
-            keys.append(("doi", normalized_doi))
-    if paper.arxiv_id:
-        normalized_arxiv = _normalize_arxiv_key(paper.arxiv_id)
-        if normalized_arxiv:
-            keys.append(("arxiv", normalized_arxiv))
-    return keys
-
-
-def _topics_override_for_paper(paper, overrides: dict[tuple[str, str], list[str]]) -> list[str] | None:
-    for key in _paper_override_keys(paper):
-        if key in overrides:
-            return overrides[key]
+def _topics_override_for_paper(paper, overrides: dict[str, list[str]], identity: IdentityIndex) -> list[str] | None:
+    """Return the override for any alias the identity index knows for ``paper``, old bibcodes included."""
+    for alias in identity.aliases.get(paper.paper_id) or paper_aliases(paper):
+        if alias in overrides:
+            return overrides[alias]
     return None
 
 
@@ -162,21 +213,71 @@ def _extract_response_text(payload: dict) -> str:
     return "\n".join(out_chunks).strip()
 
 
-def classify_topics_with_openai(
+def _confidence_value(value: object) -> float | None:
+    try:
+        confidence = float(value)  # type: ignore[arg-type]
+    except Exception:
+        return None
+    return max(0.0, min(1.0, confidence))
+
+
+def _classification_schema(allowed_topics: list[str]) -> dict:
+    return {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "string"},
+                        "topics": {"type": "array", "items": {"type": "string", "enum": allowed_topics}},
+                        "confidence": {"type": "number"},
+                    },
+                    "required": ["id", "topics", "confidence"],
+                    "additionalProperties": False,
+                },
+            }
+        },
+        "required": ["results"],
+        "additionalProperties": False,
+    }
+
+
+def _post_openai_response(api_key: str, body: dict, timeout: float = 90, retries: int | None = None) -> dict:
+    return json.loads(
+        CLIENT.post(
+            OPENAI_RESPONSES_URL,
+            json.dumps(body).encode("utf-8"),
+            headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+            timeout=timeout,
+            retries=retries,
+        )
+    )
+
+
+def classify_batch_with_openai(
     *,
     api_key: str,
     model: str,
-    title: str,
-    abstract: str,
+    papers: list[tuple[str, str, str]],
     allowed_topics: list[str],
-) -> tuple[list[str], float | None]:
+    retries: int | None = None,
+) -> dict[str, tuple[list[str], float | None]]:
+    """Classify several ``(id, title, abstract)`` papers with one structured-output request.
+
+    Results are validated against ``allowed_topics`` and keyed by id; papers the
+    model left out of its answer are absent from the returned dict.
+    """
+    listing = "\n\n".join(
+        f"Paper id: {paper_id}\nTitle: {title}\nAbstract: {abstract}" for paper_id, title, abstract in papers
+    )
     prompt = (
-        "Classify the paper into zero or more topics from the allowed list.\n"
-        "Return strict JSON only with keys: topics (array of strings), confidence (0..1).\n"
+        "Classify each paper into zero or more topics from the allowed list.\n"
+        "Return one result per paper id with keys: id, topics (array of strings), confidence (0..1).\n"
         "Do not invent topics.\n\n"
         f"Allowed topics: {json.dumps(allowed_topics)}\n\n"
-        f"Title: {title}\n\n"
-        f"Abstract: {abstract}\n"
+        f"{listing}\n"
     )
     body = {
         "model": model,
@@ -192,50 +293,150 @@ def classify_topics_with_openai(
             },
             {"role": "user", "content": [{"type": "input_text", "text": prompt}]},
         ],
-    }
-    req = urllib.request.Request(
-        "https://api.openai.com/v1/responses",
-        data=json.dumps(body).encode("utf-8"),
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "ads-data-sync-script",
+        "text": {
+            "format": {
+                "type": "json_schema",
+                "name": "topic_classification",
+                "schema": _classification_schema(allowed_topics),
+                "strict": True,
+            }
         },
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=45) as resp:
-        payload = json.loads(resp.read().decode("utf-8"))
+    }
+    payload = _post_openai_response(api_key, body, retries=retries)
 
-    text = _extract_response_text(payload)
-    obj = _extract_json_object(text)
+    obj = _extract_json_object(_extract_response_text(payload))
+    wanted = {paper_id for paper_id, _, _ in papers}
     allowed_set = set(allowed_topics)
-    topics = [t for t in (obj.get("topics") or []) if t in allowed_set]
-    confidence = obj.get("confidence")
-    try:
-        confidence = float(confidence)
-    except Exception:
-        confidence = None
-    if confidence is not None:
-        confidence = max(0.0, min(1.0, confidence))
-    return topics, confidence
+    results: dict[str, tuple[list[str], float | None]] = {}
+    for item in obj.get("results") or []:
+        if not isinstance(item, dict):
+            continue
+        paper_id = str(item.get("id") or "")
+        if paper_id not in wanted or paper_id in results:
+            continue
+        raw_topics = item.get("topics") if isinstance(item.get("topics"), list) else []
+        topics = [t for t in raw_topics if t in allowed_set]
+        results[paper_id] = (topics, _confidence_value(item.get("confidence")))
+    return results
 
 
-def main() -> int:
+def classify_papers(
+    papers: list[tuple[str, str, str]],
+    *,
+    api_key: str,
+    model: str,
+    allowed_topics: list[str],
+    batch_size: int = DEFAULT_CLASSIFY_BATCH_SIZE,
+    workers: int = DEFAULT_CLASSIFY_WORKERS,
+    retries: int = DEFAULT_CLASSIFY_RETRIES,
+) -> dict[str, tuple[list[str], float | None]]:
+    """Classify papers in batches on a bounded worker pool.
+
+    Rate-limited (429) and server errors are retried up to ``retries`` times by
+    the shared HTTP client. Papers whose batch ultimately fails are missing from
+    the result.
+    """
+    batches = [papers[i : i + max(1, batch_size)] for i in range(0, len(papers), max(1, batch_size))]
+
+    def run(batch: list[tuple[str, str, str]]) -> dict[str, tuple[list[str], float | None]]:
+        try:
+            with span("openai.batch", "classify", papers=len(batch)):
+                return classify_batch_with_openai(
+                    api_key=api_key,
+                    model=model,
+                    papers=batch,
+                    allowed_topics=allowed_topics,
+                    retries=retries,
+                )
+        except Exception:
+            return {}
+
+    results: dict[str, tuple[list[str], float | None]] = {}
+    if not batches:
+        return results
+    with span("classify", papers=len(papers), batches=len(batches)):
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as pool:
+            for batch_results in pool.map(run, batches):
+                results.update(batch_results)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--author", default="Tejaswi Venumadhav")
-    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=500, help="ADS page size for cursorMark paging.")
+    parser.add_argument("--max-docs", type=int, default=None, help="Stop after this many ADS records.")
+    parser.add_argument(
+        "--full-resync",
+        action="store_true",
+        help="Ignore the stored watermark and rebuild the paper list from a full ADS query.",
+    )
+    parser.add_argument(
+        "--full-resync-days",
+        type=int,
+        default=DEFAULT_FULL_RESYNC_DAYS,
+        help="Run a full resync when the last one is older than this many days (0 disables the check).",
+    )
+    parser.add_argument("--watermark-field", choices=WATERMARK_FIELDS, default=DEFAULT_WATERMARK_FIELD)
+    parser.add_argument(
+        "--citations-only",
+        action="store_true",
+        help="Only refresh citation_count for the stored bibcodes and patch the JSON in place.",
+    )
     parser.add_argument("--token-env", default="ADS_API_TOKEN")
     parser.add_argument("--dotenv", default=".env")
     parser.add_argument("--out", default="data/ads_publications.json")
+    parser.add_argument("--inspire-workers", type=int, default=DEFAULT_INSPIRE_WORKERS)
+    parser.add_argument("--per-host-limit", type=int, default=DEFAULT_PER_HOST_LIMIT)
+    parser.add_argument("--inspire-batch-size", type=int, default=INSPIRE_BATCH_SIZE)
+    parser.add_argument("--inspire-cache", default=DEFAULT_CACHE_JSON)
+    parser.add_argument("--inspire-miss-ttl-days", type=int, default=DEFAULT_MISS_TTL_DAYS)
     parser.add_argument("--skip-abstracts", action="store_true")
-    parser.add_argument("--refresh-abstracts", action="store_true")
+    parser.add_argument(
+        "--no-fuzzy-dedupe",
+        action="store_true",
+        help="Only merge records sharing an identifier (skip the MinHash near-duplicate pass).",
+    )
+    parser.add_argument(
+        "--refresh-abstracts",
+        action="store_true",
+        help="Re-fetch every abstract (implies --full-resync).",
+    )
+    parser.add_argument(
+        "--compact-authors-above",
+        type=int,
+        default=COMPACT_AUTHORS_ABOVE,
+        help="Store only the first names of papers with more authors (full lists go to the sidecar); 0 keeps all.",
+    )
     parser.add_argument("--topics-file", default="data/topics.json")
     parser.add_argument("--overrides-file", default="data/topic_overrides.json")
     parser.add_argument("--skip-topics", action="store_true")
     parser.add_argument("--refresh-topics", action="store_true")
     parser.add_argument("--openai-key-env", default="OPENAI_API_KEY")
     parser.add_argument("--openai-model", default=os.environ.get("OPENAI_MODEL", "gpt-4.1-mini"))
-    args = parser.parse_args()
+    parser.add_argument("--classify-batch-size", type=int, default=DEFAULT_CLASSIFY_BATCH_SIZE)
+    parser.add_argument("--classify-workers", type=int, default=DEFAULT_CLASSIFY_WORKERS)
+    parser.add_argument("--classify-retries", type=int, default=DEFAULT_CLASSIFY_RETRIES)
+    parser.add_argument("--topic-cache", default=DEFAULT_TOPIC_CACHE_JSON)
+    parser.add_argument(
+        "--local-classifier",
+        choices=("off", "prescreen", "only"),
+        default="off",
+        help=(
+            "Opt-in offline naive Bayes pre-screen: label confident papers locally, send the rest to the "
+            "LLM. With 'off', locally labelled papers are reclassified by the LLM."
+        ),
+    )
+    parser.add_argument("--local-threshold", type=float, default=DEFAULT_LOCAL_THRESHOLD)
+    parser.add_argument("--trace-out", default=None, help="Write a Chrome trace (JSON) of HTTP calls and stages.")
+    parser.add_argument(
+        "--trace-summary",
+        default=None,
+        help="Append a Markdown timing table to this file (e.g. \"$GITHUB_STEP_SUMMARY\").",
+    )
+    args = parser.parse_args(argv)
+    if 0 < args.compact_authors_above < NTH_AUTHOR_THRESHOLD:
+        parser.error(f"--compact-authors-above must be 0 or at least {NTH_AUTHOR_THRESHOLD}")
 
     load_dotenv(Path(args.dotenv))
     token = os.environ.get(args.token_env, "").strip()
@@ -244,54 +445,225 @@ def main() -> int:
         return 2
 
     out_path = Path(args.out)
-    enrichment_by_bibcode = load_enrichment_map(out_path)
+    if args.citations_only:
+        if not out_path.exists():
+            print(f"Missing {out_path}; run a full sync first.", file=sys.stderr)
+            return 2
+        bibcodes = [paper.bibcode for paper in read_papers_json(out_path)]
+        counts = fetch_citation_counts(token=token, bibcodes=bibcodes)
+        changed = patch_citation_counts(out_path, counts)
+        print(f"Citation counts: fetched={len(counts)}, changed={changed} (of {len(bibcodes)} papers)")
+        return 0
+
+    enrichment_by_id = load_enrichment_map(out_path)
     topics = load_topics(Path(args.topics_file))
     current_topics_version = topics_version(topics)
     overrides = load_overrides(Path(args.overrides_file))
 
-    docs = fetch_ads_docs(token=token, author_name=args.author, rows=args.rows)
-    papers = clean_and_dedupe(docs)
-    enrich_with_inspire(papers)
+    previous_papers = read_papers_json(out_path) if out_path.exists() else []
+    identity = IdentityIndex.from_papers(previous_papers)
+    previous_state = read_sync_state(out_path)
+    since = None
+    today = date.today()
+    incremental = not (args.full_resync or args.refresh_abstracts) and previous_papers
+    if incremental and args.full_resync_days > 0:
+        try:
+            last_full = date.fromisoformat(str(previous_state.get("full_sync") or ""))
+        except ValueError:
+            last_full = None
+        incremental = last_full is not None and today - last_full <= timedelta(days=args.full_resync_days)
+    if incremental and previous_state.get("watermark_field") == args.watermark_field:
+        since = previous_state.get("watermark")
+
+    missing_abstracts = sum(1 for paper in previous_papers if not paper.has_abstract)
+    include_abstract = not args.skip_abstracts and (
+        args.refresh_abstracts
+        or bool(since)
+        or not previous_papers
+        or missing_abstracts > ABSTRACTS_INLINE_FRACTION * len(previous_papers)
+    )
+
+    doc_stats = {"docs": 0, "watermark": since}
+    docs = iter_ads_docs(
+        token=token,
+        author_name=args.author,
+        rows=args.rows,
+        since=since,
+        watermark_field=args.watermark_field,
+        max_docs=args.max_docs,
+        include_abstract=include_abstract,
+    )
+    with span("ads.query", incremental=bool(since)) as ads_span:
+        papers = clean_and_dedupe(
+            _track_docs(docs, doc_stats, args.watermark_field), near_duplicates=not args.no_fuzzy_dedupe
+        )
+        ads_span["docs"] = doc_stats["docs"]
+    # A --max-docs cut may have skipped records: merge what was fetched into the
+    # stored papers (even on a full resync) and keep both watermarks where they were.
+    truncated = args.max_docs is not None and doc_stats["docs"] >= args.max_docs
+    if since or (truncated and previous_papers):
+        fresh_bibcodes = {paper.bibcode for paper in papers}
+        papers = merge_papers(previous_papers, papers, near_duplicates=not args.no_fuzzy_dedupe)
+        # Stored records are only refetched when they change, but citations change daily.
+        stored = [paper for paper in papers if paper.bibcode not in fresh_bibcodes]
+        with span("ads.citations", bibcodes=len(stored)):
+            counts = fetch_citation_counts(token=token, bibcodes=[paper.bibcode for paper in stored])
+        for paper in stored:
+            paper.citation_count = counts.get(paper.bibcode, paper.citation_count)
+    previous_watermark = (
+        previous_state.get("watermark") if previous_state.get("watermark_field") == args.watermark_field else None
+    )
+    sync_state = {
+        "watermark_field": args.watermark_field,
+        "watermark": previous_watermark if truncated else doc_stats["watermark"],
+        "full_sync": previous_state.get("full_sync") if since or truncated else today.isoformat(),
+        "topics": topics,
+    }
+
+    inspire_cache = InspireCache.load(Path(args.inspire_cache), miss_ttl_days=args.inspire_miss_ttl_days)
+    for previous in previous_papers:
+        inspire_cache.seed(previous.arxiv_id, previous.doi, previous.inspire_recid)
+    with span("inspire.enrich", papers=len(papers)):
+        enrich_with_inspire(
+            papers,
+            workers=args.inspire_workers,
+            per_host_limit=args.per_host_limit,
+            batch_size=args.inspire_batch_size,
+            cache=inspire_cache,
+        )
+    inspire_cache.save()
+
+    # Resolve fresh records to stored paper ids so enrichment survives bibcode changes.
+    identity.assign(papers)
+    enrichment_by_bibcode = {
+        paper.bibcode: enrichment_by_id[paper.paper_id] for paper in papers if paper.paper_id in enrichment_by_id
+    }
 
     abstracts_fetched = 0
     if not args.skip_abstracts:
         missing_bibcodes: list[str] = []
         for paper in papers:
-            current = (enrichment_by_bibcode.get(paper.bibcode, {}) or {}).get("abstract")
-            if args.refresh_abstracts or not current:
+            entry = enrichment_by_bibcode.setdefault(paper.bibcode, {})
+            if entry.get("abstract") and not args.refresh_abstracts:
+                continue
+            if include_abstract and paper.abstract:
+                entry["abstract"] = paper.abstract
+                abstracts_fetched += 1
+            else:
                 missing_bibcodes.append(paper.bibcode)
 
-        abstracts = fetch_abstracts_for_bibcodes(token=token, bibcodes=missing_bibcodes)
-        abstracts_fetched = len(abstracts)
-        for paper in papers:
-            entry = enrichment_by_bibcode.setdefault(paper.bibcode, {})
-            current = entry.get("abstract")
-            if args.refresh_abstracts or not current:
-                entry["abstract"] = abstracts.get(paper.bibcode, current)
+        with span("ads.abstracts", bibcodes=len(missing_bibcodes)):
+            abstracts = fetch_abstracts_for_bibcodes(token=token, bibcodes=missing_bibcodes)
+        abstracts_fetched += len(abstracts)
+        for bibcode in missing_bibcodes:
+            entry = enrichment_by_bibcode[bibcode]
+            entry["abstract"] = abstracts.get(bibcode, entry.get("abstract"))
 
     classified = 0
     classify_skipped = 0
     classify_errors = 0
+    classify_cached = 0
+    classify_local = 0
+    topics_rewritten = 0
+    topic_checks = 0
     api_key = os.environ.get(args.openai_key_env, "").strip()
+    use_llm = bool(api_key) and args.local_classifier != "only"
+    use_local = args.local_classifier != "off" and not args.refresh_topics
     do_classification = not args.skip_topics
     if do_classification:
         if not topics:
             print("Topics: empty topic list; skipping classification.")
             do_classification = False
-        elif not api_key:
+        elif not (use_llm or use_local):
             print(f"Topics: {args.openai_key_env} not set; skipping classification.")
             do_classification = False
+        elif not use_llm and args.local_classifier != "only":
+            print(f"Topics: {args.openai_key_env} not set; using the local classifier only.")
 
+    previous_topic_list = [str(t) for t in previous_state.get("topics") or []]
+    previous_version = topics_version(previous_topic_list) if previous_topic_list else None
     if do_classification:
+        topic_cache = TopicCache.load(Path(args.topic_cache))
+        local_model = None
+        if use_local:
+            # Train only on labels made under the current topic list.
+            training = [
+                paper
+                for paper in previous_papers
+                if paper.topic_source == "manual_override" or paper.topics_classified_with == current_topics_version
+            ]
+            local_model = TopicModel.from_papers(training, topics)
+
+        if previous_version and previous_version != current_topics_version and not args.refresh_topics:
+            renamed, removed, added = diff_topics(
+                previous_topic_list,
+                topics,
+                load_topic_renames(Path(args.topics_file)),
+            )
+            print(
+                f"Topic list diff: added={len(added)}, removed={len(removed)}, renamed={len(renamed)}",
+            )
+            membership_jobs: list[tuple[str, str, str]] = []
+            for paper in papers:
+                if _topics_override_for_paper(paper, overrides, identity) is not None:
+                    continue
+                entry = enrichment_by_bibcode.setdefault(paper.bibcode, {})
+                if entry.get("topics_classified_with") != previous_version:
+                    continue
+                # Removals and renames are a pure rewrite of the stored labels.
+                rewritten: list[str] = []
+                for topic in entry.get("topics") or []:
+                    topic = renamed.get(topic, topic)
+                    if topic not in removed and topic not in rewritten:
+                        rewritten.append(topic)
+                entry["topics"] = rewritten
+                abstract = (entry.get("abstract") or "").strip()
+                if added and abstract:
+                    # Additions need a targeted check; keep the old version until it succeeds.
+                    if use_llm:
+                        membership_jobs.append((paper.bibcode, paper.title, abstract))
+                    continue
+                entry["topics_classified_with"] = current_topics_version
+                topics_rewritten += 1
+
+            membership = classify_papers(
+                membership_jobs,
+                api_key=api_key,
+                model=args.openai_model,
+                allowed_topics=added,
+                batch_size=args.classify_batch_size,
+                workers=args.classify_workers,
+                retries=args.classify_retries,
+            )
+            for bibcode, title, abstract in membership_jobs:
+                if bibcode not in membership:
+                    continue
+                entry = enrichment_by_bibcode[bibcode]
+                extra, _ = membership[bibcode]
+                labels = set(entry["topics"]) | set(extra)
+                entry["topics"] = [t for t in topics if t in labels]
+                entry["topics_classified_with"] = current_topics_version
+                if entry.get("topic_source") == "llm":
+                    topic_cache.put(
+                        classification_key(title, abstract, topics, args.openai_model),
+                        entry["topics"],
+                        entry.get("topic_confidence"),
+                        args.openai_model,
+                    )
+                topics_rewritten += 1
+                topic_checks += 1
+        cache_keys: dict[str, str] = {}
+        jobs: list[tuple[str, str, str]] = []
         for paper in papers:
-            if _topics_override_for_paper(paper, overrides) is not None:
+            if _topics_override_for_paper(paper, overrides, identity) is not None:
                 classify_skipped += 1
                 continue
             entry = enrichment_by_bibcode.setdefault(paper.bibcode, {})
-            previous_topics = entry.get("topics") or []
-            previous_version = entry.get("topics_classified_with")
-            needs_classification = args.refresh_topics or (not previous_topics) or (
-                previous_version != current_topics_version
+            needs_classification = (
+                args.refresh_topics
+                or (not entry.get("topics"))
+                or (entry.get("topics_classified_with") != current_topics_version)
+                or (entry.get("topic_source") == "local" and use_llm and not use_local)
             )
             if not needs_classification:
                 classify_skipped += 1
@@ -302,31 +674,58 @@ def main() -> int:
                 classify_skipped += 1
                 continue
 
-            ok = False
-            for _ in range(2):
-                try:
-                    new_topics, confidence = classify_topics_with_openai(
-                        api_key=api_key,
-                        model=args.openai_model,
-                        title=paper.title,
-                        abstract=abstract,
-                        allowed_topics=topics,
-                    )
-                    entry["topics"] = new_topics
-                    entry["topic_source"] = "llm"
-                    entry["topic_confidence"] = confidence
+            cache_key = classification_key(paper.title, abstract, topics, args.openai_model)
+            cached = None if args.refresh_topics else topic_cache.get(cache_key)
+            if cached is not None:
+                entry["topics"], entry["topic_confidence"] = cached
+                entry["topic_source"] = "llm"
+                entry["topics_classified_with"] = current_topics_version
+                classify_cached += 1
+                continue
+
+            if local_model is not None:
+                local_topics, local_confidence = local_model.predict(paper.title, abstract)
+                if local_confidence >= args.local_threshold:
+                    entry["topics"] = local_topics
+                    entry["topic_source"] = "local"
+                    entry["topic_confidence"] = round(local_confidence, 4)
                     entry["topics_classified_with"] = current_topics_version
-                    classified += 1
-                    ok = True
-                    break
-                except Exception:
-                    time.sleep(1.0)
-            if not ok:
+                    classify_local += 1
+                    continue
+
+            if not use_llm:
+                classify_skipped += 1
+                continue
+
+            cache_keys[paper.bibcode] = cache_key
+            jobs.append((paper.bibcode, paper.title, abstract))
+
+        results = classify_papers(
+            jobs,
+            api_key=api_key,
+            model=args.openai_model,
+            allowed_topics=topics,
+            batch_size=args.classify_batch_size,
+            workers=args.classify_workers,
+            retries=args.classify_retries,
+        )
+        for bibcode, _, _ in jobs:
+            if bibcode not in results:
                 classify_errors += 1
+                continue
+            new_topics, confidence = results[bibcode]
+            entry = enrichment_by_bibcode[bibcode]
+            entry["topics"] = new_topics
+            entry["topic_source"] = "llm"
+            entry["topic_confidence"] = confidence
+            entry["topics_classified_with"] = current_topics_version
+            topic_cache.put(cache_keys[bibcode], new_topics, confidence, args.openai_model)
+            classified += 1
+        topic_cache.save()
 
     overrides_applied = 0
     for paper in papers:
-        override_topics = _topics_override_for_paper(paper, overrides)
+        override_topics = _topics_override_for_paper(paper, overrides, identity)
         if override_topics is None:
             continue
         entry = enrichment_by_bibcode.setdefault(paper.bibcode, {})
@@ -337,11 +736,34 @@ def main() -> int:
         entry["topics_classified_with"] = current_topics_version
         overrides_applied += 1
 
-    write_papers_json(out_path, papers, enrichment_by_bibcode=enrichment_by_bibcode)
+    # Papers whose new-topic checks were skipped, deferred or failed keep labels made
+    # under the previous list; keep that list as the diff base until none are left.
+    if previous_version and any(
+        entry.get("topics_classified_with") == previous_version for entry in enrichment_by_bibcode.values()
+    ):
+        sync_state["topics"] = previous_topic_list
+
+    with span("write", papers=len(papers)):
+        write_papers_json(
+            out_path,
+            papers,
+            enrichment_by_bibcode=enrichment_by_bibcode,
+            sync_state=sync_state,
+            compact_authors_above=args.compact_authors_above,
+        )
+    export_trace(args.trace_out, args.trace_summary, title="ADS sync timing")
 
     print(f"Wrote {args.out}")
-    print(f"Counts: docs={len(docs)}, papers={len(papers)}")
+    if since:
+        print(f"Mode: incremental ({args.watermark_field} >= {since})")
+    else:
+        print("Mode: full resync")
+    if truncated:
+        print(f"Stopped at --max-docs={args.max_docs}; merged into the stored papers, watermarks not advanced.")
+    print(f"Counts: docs={doc_stats['docs']}, papers={len(papers)}")
     print(f"Topics version: {current_topics_version}")
+    if topics_rewritten:
+        print(f"Topics carried over from the previous list: {topics_rewritten} (checked for new topics={topic_checks})")
     if args.skip_abstracts:
         print("Abstracts: skipped")
     else:
@@ -350,7 +772,8 @@ def main() -> int:
         print("Topics: skipped")
     else:
         print(
-            f"Topics classified: {classified} (skipped={classify_skipped}, errors={classify_errors}, overrides={overrides_applied})",
+            f"Topics classified: {classified} (cached={classify_cached}, local={classify_local}, skipped={classify_skipped}, "
+            f"errors={classify_errors}, overrides={overrides_applied})",
         )
     return 0
 
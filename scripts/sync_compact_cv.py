@@ -11,8 +11,9 @@ import argparse
 import re
 from pathlib import Path
 
-from ads_data import AdsPaper, read_papers_json
+from ads_data import ARXIV_VENUE, AdsPaper, read_papers_json
 from cv_profile import DEFAULT_PROFILE_JSON, read_cv_profile
+from outputs import write_if_changed
 from sync_cv import compute_h_index, split_papers, tex_escape
 
 DEFAULT_ADS_JSON = "data/ads_publications.json"
@@ -27,19 +28,7 @@ RECENT_SELECTED_BIBCODES = [
 ]
 
 
-def is_tejaswi(name: str) -> bool:
-    if "," in name:
-        last, first = [x.strip().lower() for x in name.split(",", 1)]
-    else:
-        bits = name.strip().lower().split()
-        if not bits:
-            return False
-        last = bits[-1]
-        first = " ".join(bits[:-1])
-    return last == "venumadhav" and first.startswith("tejaswi")
-
-
-def format_author(name: str) -> str:
+def format_author(name: str, own: bool = False) -> str:
     if "," in name:
         last, first = [x.strip() for x in name.split(",", 1)]
     else:
@@ -47,22 +36,22 @@ def format_author(name: str) -> str:
         last, first = bits[-1], " ".join(bits[:-1])
     initials = "".join(f"{bit[0]}." for bit in re.split(r"[\s\-]+", first) if bit)
     core = f"{tex_escape(last)}, {initials}" if initials else tex_escape(last)
-    return rf"\textbf{{{core}}}" if is_tejaswi(name) else core
+    return rf"\textbf{{{core}}}" if own else core
 
 
-def format_authors(authors: list[str], max_authors: int = 8) -> str:
+def format_authors(authors: list[str], max_authors: int = 8, own_index: int | None = None) -> str:
     if not authors:
         return "Unknown"
     if len(authors) > max_authors:
-        shown = ", ".join(format_author(author) for author in authors[: max_authors - 1])
-        return f"{shown}, et al."
-    return ", ".join(format_author(author) for author in authors)
+        authors = authors[: max_authors - 1]
+        return ", ".join(format_author(author, i == own_index) for i, author in enumerate(authors)) + ", et al."
+    return ", ".join(format_author(author, i == own_index) for i, author in enumerate(authors))
 
 
 def venue(paper: AdsPaper) -> str:
     if paper.pub and paper.volume and paper.page:
         return f"{tex_escape(paper.pub)}, {tex_escape(paper.volume)}, {tex_escape(paper.page)}"
-    if paper.pub and "arxiv e-prints" not in paper.pub.lower():
+    if paper.pub and paper.venue != ARXIV_VENUE:
         return tex_escape(paper.pub)
     if paper.arxiv_id:
         return f"arXiv:{tex_escape(paper.arxiv_id)}"
@@ -87,7 +76,7 @@ def selected_papers(refereed: list[AdsPaper], limit: int) -> list[AdsPaper]:
 
 def render_paper_item(paper: AdsPaper) -> str:
     return (
-        rf"\item {format_authors(paper.authors)} ({paper.year}). "
+        rf"\item {format_authors(paper.authors, own_index=paper.own_author_index)} ({paper.year}). "
         rf"\emph{{{tex_escape(paper.title)}}}. {venue(paper)}."
     )
 
@@ -184,9 +173,13 @@ def render_compact_cv(papers: list[AdsPaper], selected_limit: int, profile: dict
     return "\n".join(lines)
 
 
-def write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+def write_text(path: Path, text: str) -> bool:
+    return write_if_changed(path, text)
+
+
+def generate(papers: list[AdsPaper], profile: dict, out: Path, selected_limit: int = DEFAULT_SELECTED_LIMIT) -> bool:
+    """Write the compact CV TeX; return True if it changed."""
+    return write_text(out, render_compact_cv(papers, selected_limit, profile))
 
 
 def main() -> int:
@@ -201,13 +194,13 @@ def main() -> int:
     if not ads_json_path.exists():
         raise SystemExit(f"Missing ADS data file: {ads_json_path}. Run python scripts/sync_ads_data.py first.")
 
-    tex = render_compact_cv(
+    changed = generate(
         read_papers_json(ads_json_path),
-        args.selected_limit,
         read_cv_profile(args.profile),
+        Path(args.out),
+        args.selected_limit,
     )
-    write_text(Path(args.out), tex)
-    print(f"Wrote {args.out}")
+    print(f"{'Wrote' if changed else 'No changes in'} {args.out}")
     return 0
 
 
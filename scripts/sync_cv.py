@@ -14,6 +14,7 @@ from pathlib import Path
 
 from ads_data import AdsPaper, read_papers_json
 from cv_profile import DEFAULT_PROFILE_JSON, read_cv_profile, render_ucsb_work_experience
+from outputs import write_if_changed
 
 PUBLIC_REMOVE_SECTIONS = {
     "Current and Pending Support",
@@ -57,19 +58,7 @@ def tex_escape(text: str) -> str:
     return out
 
 
-def is_tejaswi(name: str) -> bool:
-    if "," in name:
-        last, first = [x.strip().lower() for x in name.split(",", 1)]
-    else:
-        bits = name.strip().lower().split()
-        if not bits:
-            return False
-        last = bits[-1]
-        first = " ".join(bits[:-1])
-    return last == "venumadhav" and first.startswith("tejaswi")
-
-
-def format_author(name: str) -> str:
+def format_author(name: str, own: bool = False) -> str:
     if "," in name:
         last, first = [x.strip() for x in name.split(",", 1)]
     else:
@@ -77,13 +66,13 @@ def format_author(name: str) -> str:
         last, first = bits[-1], " ".join(bits[:-1])
     initials = "".join(f"{b[0]}." for b in re.split(r"[\s\-]+", first) if b)
     core = f"{tex_escape(last)}, {initials}" if initials else tex_escape(last)
-    return r"\textbf{" + core + "}" if is_tejaswi(name) else core
+    return r"\textbf{" + core + "}" if own else core
 
 
-def format_author_list(authors: list[str]) -> str:
+def format_author_list(authors: list[str], own_index: int | None = None) -> str:
     if not authors:
         return ""
-    formatted = [format_author(a) for a in authors]
+    formatted = [format_author(a, i == own_index) for i, a in enumerate(authors)]
     if len(formatted) == 1:
         return formatted[0]
     if len(formatted) == 2:
@@ -92,15 +81,10 @@ def format_author_list(authors: list[str]) -> str:
 
 
 def split_papers(papers: list[AdsPaper], nth_threshold: int) -> tuple[list[AdsPaper], list[AdsPaper], list[AdsPaper]]:
-    nth = [paper for paper in papers if len(paper.authors) > nth_threshold]
-    non_nth = [paper for paper in papers if len(paper.authors) <= nth_threshold]
-    preprints = [
-        paper
-        for paper in non_nth
-        if paper.doctype == "eprint" or "arxiv e-prints" in paper.pub.lower()
-    ]
-    preprint_keys = {paper.bibcode for paper in preprints}
-    refereed = [paper for paper in non_nth if paper.bibcode not in preprint_keys]
+    nth = [paper for paper in papers if paper.author_count > nth_threshold]
+    non_nth = [paper for paper in papers if paper.author_count <= nth_threshold]
+    preprints = [paper for paper in non_nth if paper.is_preprint]
+    refereed = [paper for paper in non_nth if not paper.is_preprint]
     return refereed, preprints, nth
 
 
@@ -137,7 +121,7 @@ def render_highlights(refereed: list[AdsPaper], total_h_index: int) -> str:
     ]
     for paper in top:
         lines.append(
-            rf"\item {format_author_list(paper.authors)}, \ ({paper.year}), {format_citation_line(paper)} \\",
+            rf"\item {format_author_list(paper.authors, paper.own_author_index)}, \ ({paper.year}), {format_citation_line(paper)} \\",
         )
         lines.append(rf"Title: {tex_escape(paper.title)} \\")
         lines.append(rf"Citation count: {paper.citation_count} \\")
@@ -152,7 +136,7 @@ def render_refereed(refereed: list[AdsPaper]) -> str:
         r"\begin{enumerate}[leftmargin=*,itemsep=0.32em,topsep=0.3em]",
     ]
     for paper in refereed:
-        lines.append(rf"\item {format_author_list(paper.authors)}, \ ({paper.year}), {format_citation_line(paper)} \\")
+        lines.append(rf"\item {format_author_list(paper.authors, paper.own_author_index)}, \ ({paper.year}), {format_citation_line(paper)} \\")
         lines.append(rf"Title: {tex_escape(paper.title)}")
     lines.extend([r"\end{enumerate}", r"\end{cvlist}", r"\cvsectionend"])
     return "\n".join(lines) + "\n"
@@ -166,7 +150,7 @@ def render_preprints(preprints: list[AdsPaper]) -> str:
     ]
     for paper in preprints:
         arxiv_part = f"arXiv:{tex_escape(paper.arxiv_id)}" if paper.arxiv_id else tex_escape(paper.bibcode)
-        lines.append(rf"\item {format_author_list(paper.authors)}, \ ({paper.year}), {arxiv_part} \\")
+        lines.append(rf"\item {format_author_list(paper.authors, paper.own_author_index)}, \ ({paper.year}), {arxiv_part} \\")
         lines.append(rf"Title: {tex_escape(paper.title)}")
     lines.extend([r"\end{enumerate}", r"\end{cvlist}", r"\cvsectionend"])
     return "\n".join(lines) + "\n"
@@ -179,7 +163,7 @@ def render_nth(nth: list[AdsPaper]) -> str:
         r"\begin{enumerate}[leftmargin=*,itemsep=0.32em,topsep=0.3em]",
     ]
     for paper in nth:
-        first = format_author(paper.authors[0]) if paper.authors else tex_escape("Unknown")
+        first = format_author(paper.authors[0], paper.own_author_index == 0) if paper.authors else tex_escape("Unknown")
         lines.append(rf"\item {first}, et. al., ({paper.year}), {format_citation_line(paper)} \\")
         lines.append(rf"Title: {tex_escape(paper.title)}")
     lines.extend([r"\end{enumerate}", r"\end{cvlist}", r"\cvsectionend"])
@@ -234,9 +218,38 @@ def apply_cv_profile(tex: str, profile: dict) -> str:
     return tex
 
 
-def write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+def write_text(path: Path, text: str) -> bool:
+    return write_if_changed(path, text)
+
+
+def generate(
+    papers: list[AdsPaper],
+    template_source: str,
+    profile: dict,
+    out_private: Path,
+    out_public: Path,
+    nth_threshold: int = 12,
+) -> dict[str, int]:
+    """Write the private and public CV TeX; return section counts and how many files changed."""
+    template = apply_cv_profile(template_source, profile)
+    refereed, preprints, nth = split_papers(papers, nth_threshold)
+    total_h_index = compute_h_index(papers)
+
+    private_tex = template
+    private_tex = replace_section_body(private_tex, "Publication Highlights", render_highlights(refereed, total_h_index))
+    private_tex = replace_section_body(private_tex, "Refereed Publications", render_refereed(refereed))
+    private_tex = replace_section_body(private_tex, "Preprints on the Arxiv", render_preprints(preprints))
+    private_tex = replace_section_body(private_tex, "N-th Author Papers", render_nth(nth))
+
+    public_tex = remove_sections(private_tex, PUBLIC_REMOVE_SECTIONS)
+
+    changed = [write_text(out_private, private_tex), write_text(out_public, public_tex)]
+    return {
+        "refereed": len(refereed),
+        "preprints": len(preprints),
+        "nth_author": len(nth),
+        "changed": sum(changed),
+    }
 
 
 def main() -> int:
@@ -253,28 +266,21 @@ def main() -> int:
     if not ads_json_path.exists():
         raise SystemExit(f"Missing ADS data file: {ads_json_path}. Run python scripts/sync_ads_data.py first.")
 
-    template = apply_cv_profile(
+    counts = generate(
+        read_papers_json(ads_json_path),
         Path(args.template).read_text(encoding="utf-8"),
         read_cv_profile(args.profile),
+        Path(args.out_private),
+        Path(args.out_public),
+        args.nth_threshold,
     )
-    papers = read_papers_json(ads_json_path)
-    refereed, preprints, nth = split_papers(papers, args.nth_threshold)
-    total_h_index = compute_h_index(papers)
-
-    private_tex = template
-    private_tex = replace_section_body(private_tex, "Publication Highlights", render_highlights(refereed, total_h_index))
-    private_tex = replace_section_body(private_tex, "Refereed Publications", render_refereed(refereed))
-    private_tex = replace_section_body(private_tex, "Preprints on the Arxiv", render_preprints(preprints))
-    private_tex = replace_section_body(private_tex, "N-th Author Papers", render_nth(nth))
-
-    public_tex = remove_sections(private_tex, PUBLIC_REMOVE_SECTIONS)
-
-    write_text(Path(args.out_private), private_tex)
-    write_text(Path(args.out_public), public_tex)
 
     print(f"Wrote {args.out_private}")
     print(f"Wrote {args.out_public}")
-    print(f"Counts: refereed={len(refereed)}, preprints={len(preprints)}, nth_author={len(nth)}")
+    print(
+        f"Counts: refereed={counts['refereed']}, preprints={counts['preprints']}, "
+        f"nth_author={counts['nth_author']}, changed_files={counts['changed']}"
+    )
     return 0
 
 
@@ -26,6 +26,7 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from outputs import write_if_changed, write_json_if_changed
 from topic_styles import topic_style_attr
 
 SECTION_RE = re.compile(r"\\cvsection(?:\[[^\]]*\])?\{([^}]*)\}")
@@ -291,7 +292,7 @@ def _sync_profile_map(
     people: list[Person],
     former_seeds: list[FormerSeed],
     placeholder_path: str,
-) -> dict[str, dict]:
+) -> tuple[dict[str, dict], bool]:
     data = _load_profile_map(path)
     people_map: dict[str, dict] = {
         name: _normalize_entry(info, placeholder_path) for name, info in data["people"].items()
@@ -333,9 +334,8 @@ def _sync_profile_map(
 
     ordered = {name: people_map[name] for name in sorted(people_map)}
     payload = {"schema_version": 4, "people": ordered}
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=False) + "\n", encoding="utf-8")
-    return ordered
+    changed = write_json_if_changed(path, payload, sort_keys=False)
+    return ordered, changed
 
 
 def _render_cards(people: list[Person], profiles: dict[str, dict], placeholder_path: str, allowed_topics: list[str]) -> str:
@@ -529,21 +529,20 @@ show_title: false
     return front_matter + "\n".join(body)
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--cv-source", default="cv/source/myresume_master.tex")
-    parser.add_argument("--out", default="05-index_group.md")
-    parser.add_argument("--placeholder", default="/assets/images/person-placeholder.svg")
-    parser.add_argument("--profile-map", default="data/group_profiles.json")
-    parser.add_argument("--photo-map", default=None, help="Deprecated alias for --profile-map")
-    parser.add_argument("--collaborators-map", default="data/collaborators.json")
-    parser.add_argument("--topics-file", default=DEFAULT_TOPICS_FILE)
-    args = parser.parse_args()
+def generate(
+    tex: str,
+    out: Path,
+    profile_map_path: Path,
+    collaborators_path: Path,
+    placeholder: str,
+    allowed_topics: list[str],
+) -> dict[str, int]:
+    """Sync the profile map from CV source ``tex`` and write the group page.
 
-    profile_map_path = Path(args.profile_map or args.photo_map or "data/group_profiles.json")
+    Returns counts, including how many of the two files actually changed.
+    """
     legacy_map_path = Path("data/group_photos.json")
 
-    tex = Path(args.cv_source).read_text(encoding="utf-8")
     grads, postdocs, undergrads = collect_people(tex)
     former_seeds = collect_former_seeds(tex)
     all_people = grads + postdocs + undergrads
@@ -565,23 +564,52 @@ def main() -> int:
                 for name, img in sorted(legacy_images.items())
             },
         }
-        profile_map_path.parent.mkdir(parents=True, exist_ok=True)
-        profile_map_path.write_text(json.dumps(migrated, indent=2, sort_keys=False) + "\n", encoding="utf-8")
+        write_json_if_changed(profile_map_path, migrated, sort_keys=False)
 
-    profiles = _sync_profile_map(profile_map_path, all_people, former_seeds, args.placeholder)
-    allowed_topics = load_topics(Path(args.topics_file))
-    collaborators_path = Path(args.collaborators_map)
+    profiles, profiles_changed = _sync_profile_map(profile_map_path, all_people, former_seeds, placeholder)
     collaborators = _load_collaborators(collaborators_path)
-    out_text = render_page(grads, postdocs, undergrads, profiles, collaborators, args.placeholder, allowed_topics)
-    Path(args.out).write_text(out_text, encoding="utf-8")
+    out_text = render_page(grads, postdocs, undergrads, profiles, collaborators, placeholder, allowed_topics)
+    page_changed = write_if_changed(out, out_text)
+    return {
+        "grads": len(grads),
+        "postdocs": len(postdocs),
+        "undergrads": len(undergrads),
+        "former_seed_candidates": len(former_seeds),
+        "collaborators": len(collaborators),
+        "changed": int(profiles_changed) + int(page_changed),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cv-source", default="cv/source/myresume_master.tex")
+    parser.add_argument("--out", default="05-index_group.md")
+    parser.add_argument("--placeholder", default="/assets/images/person-placeholder.svg")
+    parser.add_argument("--profile-map", default="data/group_profiles.json")
+    parser.add_argument("--photo-map", default=None, help="Deprecated alias for --profile-map")
+    parser.add_argument("--collaborators-map", default="data/collaborators.json")
+    parser.add_argument("--topics-file", default=DEFAULT_TOPICS_FILE)
+    args = parser.parse_args()
+
+    profile_map_path = Path(args.profile_map or args.photo_map or "data/group_profiles.json")
+    collaborators_path = Path(args.collaborators_map)
+    counts = generate(
+        Path(args.cv_source).read_text(encoding="utf-8"),
+        Path(args.out),
+        profile_map_path,
+        collaborators_path,
+        args.placeholder,
+        load_topics(Path(args.topics_file)),
+    )
 
     print(f"Wrote {args.out}")
     print(f"Wrote/updated {profile_map_path}")
     print(f"Wrote/updated {collaborators_path}")
     print(
         "Counts: "
-        f"grads={len(grads)}, postdocs={len(postdocs)}, undergrads={len(undergrads)}, "
-        f"former_seed_candidates={len(former_seeds)}, collaborators={len(collaborators)}"
+        f"grads={counts['grads']}, postdocs={counts['postdocs']}, undergrads={counts['undergrads']}, "
+        f"former_seed_candidates={counts['former_seed_candidates']}, collaborators={counts['collaborators']}, "
+        f"changed_files={counts['changed']}"
     )
     return 0
 
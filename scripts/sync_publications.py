@@ -15,6 +15,7 @@ import re
 from pathlib import Path
 
 from ads_data import AdsPaper, read_papers_json
+from outputs import write_if_changed
 from topic_styles import topic_style_attr
 
 DEFAULT_PAGE = "02-index_publications.md"
@@ -45,7 +46,7 @@ def load_topics(path: Path) -> list[str]:
     return out
 
 
-def _format_author(name: str) -> str:
+def _format_author(name: str, own: bool = False) -> str:
     if "," in name:
         last, first = [part.strip() for part in name.split(",", 1)]
     else:
@@ -54,34 +55,22 @@ def _format_author(name: str) -> str:
         first = " ".join(chunks[:-1])
     initials = "".join(f"{x[0]}." for x in re.split(r"[\s\-]+", first) if x)
     out = f"{last}, {initials}" if initials else last
-    if last.lower() == "venumadhav" and first.lower().startswith("tejaswi"):
+    if own:
         return f"<strong>{html.escape(out)}</strong>"
     return html.escape(out)
 
 
-def _is_tejaswi_name(name: str) -> bool:
-    if "," in name:
-        last, first = [part.strip().lower() for part in name.split(",", 1)]
-    else:
-        chunks = name.lower().split()
-        if not chunks:
-            return False
-        last = chunks[-1]
-        first = " ".join(chunks[:-1])
-    return last == "venumadhav" and first.startswith("tejaswi")
-
-
-def _tejaswi_author_label(authors: list[str]) -> str:
-    for author in authors:
-        if _is_tejaswi_name(author):
-            return _format_author(author)
+def _tejaswi_author_label(paper: AdsPaper) -> str:
+    # Compacted collaboration papers only store the first few names.
+    if paper.own_author_index is not None and paper.own_author_index < len(paper.authors):
+        return _format_author(paper.authors[paper.own_author_index], own=True)
     return "<strong>Venumadhav, T.</strong>"
 
 
-def _format_author_list(authors: list[str]) -> str:
+def _format_author_list(authors: list[str], own_index: int | None) -> str:
     if not authors:
         return ""
-    formatted = [_format_author(author) for author in authors]
+    formatted = [_format_author(author, index == own_index) for index, author in enumerate(authors)]
     if len(formatted) == 1:
         return formatted[0]
     if len(formatted) == 2:
@@ -102,13 +91,13 @@ def _render_entry(paper: AdsPaper, idx: int, entry_id: str, topics: list[str], n
     lines = [f'<article id="{entry_id}" class="pub-entry" data-topics="{topic_attr}">']
 
     if nth_mode:
-        first_author = _format_author(paper.authors[0]) if paper.authors else "Unknown"
-        teja_label = _tejaswi_author_label(paper.authors)
+        first_author = _format_author(paper.authors[0], paper.own_author_index == 0) if paper.authors else "Unknown"
+        teja_label = _tejaswi_author_label(paper)
         lines.append(
             f'<p class="pub-citation">{idx}. {first_author} et al. ({paper.year}; incl. {teja_label})</p>',
         )
     else:
-        lines.append(f'<p class="pub-citation">{idx}. {_format_author_list(paper.authors)} ({paper.year})</p>')
+        lines.append(f'<p class="pub-citation">{idx}. {_format_author_list(paper.authors, paper.own_author_index)} ({paper.year})</p>')
 
     lines.append(f'<p class="pub-title"><em>{html.escape(paper.title)}</em></p>')
     links = [f'<a href="{paper.ads_url}">ADS</a>']
@@ -133,7 +122,7 @@ def render_entries(papers: list[AdsPaper], allowed_topics: list[str]) -> tuple[s
     main_papers: list[AdsPaper] = []
     nth_author_papers: list[AdsPaper] = []
     for paper in papers:
-        if len(paper.authors) > 12:
+        if paper.category == "nth":
             nth_author_papers.append(paper)
         else:
             main_papers.append(paper)
@@ -290,6 +279,21 @@ def parse_front_matter(text: str) -> tuple[str, str]:
     return match.group(1), match.group(2)
 
 
+def generate(papers: list[AdsPaper], allowed_topics: list[str], target: Path) -> bool:
+    """Regenerate the publications page in place; return True if it changed."""
+    entries, chips, topic_index = render_entries(papers, allowed_topics)
+    original = target.read_text(encoding="utf-8")
+    front_matter, _ = parse_front_matter(original)
+    updated = render_full_page(
+        front_matter,
+        entries,
+        render_topic_filter(chips),
+        render_topic_fallback(chips, topic_index),
+        render_filter_script(),
+    )
+    return write_if_changed(target, updated)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--file", default=DEFAULT_PAGE)
@@ -305,22 +309,15 @@ def main() -> int:
 
     papers = read_papers_json(ads_json_path)
     allowed_topics = load_topics(Path(args.topics_file))
-    entries, chips, topic_index = render_entries(papers, allowed_topics)
-    topic_filter = render_topic_filter(chips)
-    topic_fallback = render_topic_fallback(chips, topic_index)
-    filter_script = render_filter_script()
 
     if args.preview or not args.write:
+        entries, _, _ = render_entries(papers, allowed_topics)
         print(entries)
         if not args.write:
             return 0
 
     target = Path(args.file)
-    original = target.read_text(encoding="utf-8")
-    front_matter, _ = parse_front_matter(original)
-    updated = render_full_page(front_matter, entries, topic_filter, topic_fallback, filter_script)
-    if updated != original:
-        target.write_text(updated, encoding="utf-8")
+    if generate(papers, allowed_topics, target):
         print(f"Updated {target}")
     else:
         print(f"No changes in {target}")
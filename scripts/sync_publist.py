@@ -12,6 +12,7 @@ import re
 from pathlib import Path
 
 from ads_data import AdsPaper, read_papers_json
+from outputs import write_if_changed
 
 DEFAULT_ADS_JSON = "data/ads_publications.json"
 DEFAULT_OUT = "private/publist/Tejaswi_publist.tex"
@@ -58,19 +59,7 @@ def tex_escape(text: str) -> str:
     return out
 
 
-def is_tejaswi(name: str) -> bool:
-    if "," in name:
-        last, first = [x.strip().lower() for x in name.split(",", 1)]
-    else:
-        bits = name.strip().lower().split()
-        if not bits:
-            return False
-        last = bits[-1]
-        first = " ".join(bits[:-1])
-    return last == "venumadhav" and first.startswith("tejaswi")
-
-
-def format_author(name: str) -> str:
+def format_author(name: str, own: bool = False) -> str:
     if "," in name:
         last, first = [x.strip() for x in name.split(",", 1)]
     else:
@@ -81,25 +70,20 @@ def format_author(name: str) -> str:
         first = " ".join(bits[:-1])
     initials = "".join(f"{bit[0]}." for bit in re.split(r"[\s\-]+", first) if bit)
     core = f"{tex_escape(last)}, {initials}" if initials else tex_escape(last)
-    return rf"\textbf{{{core}}}" if is_tejaswi(name) else core
+    return rf"\textbf{{{core}}}" if own else core
 
 
-def format_author_list(authors: list[str]) -> str:
+def format_author_list(authors: list[str], own_index: int | None = None) -> str:
     if not authors:
         return ""
-    return ", ".join(format_author(author) for author in authors)
+    return ", ".join(format_author(author, index == own_index) for index, author in enumerate(authors))
 
 
 def split_papers(papers: list[AdsPaper], nth_threshold: int) -> tuple[list[AdsPaper], list[AdsPaper], list[AdsPaper]]:
-    nth = [paper for paper in papers if len(paper.authors) > nth_threshold]
-    non_nth = [paper for paper in papers if len(paper.authors) <= nth_threshold]
-    preprints = [
-        paper
-        for paper in non_nth
-        if paper.doctype == "eprint" or "arxiv e-prints" in paper.pub.lower()
-    ]
-    preprint_keys = {paper.bibcode for paper in preprints}
-    refereed = [paper for paper in non_nth if paper.bibcode not in preprint_keys]
+    nth = [paper for paper in papers if paper.author_count > nth_threshold]
+    non_nth = [paper for paper in papers if paper.author_count <= nth_threshold]
+    preprints = [paper for paper in non_nth if paper.is_preprint]
+    refereed = [paper for paper in non_nth if not paper.is_preprint]
     return refereed, preprints, nth
 
 
@@ -112,10 +96,10 @@ def sort_highlights(papers: list[AdsPaper]) -> list[AdsPaper]:
 
 
 def format_citation_line(paper: AdsPaper) -> str:
-    if paper.arxiv_id and (paper.doctype == "eprint" or "arxiv e-prints" in paper.pub.lower()):
+    if paper.arxiv_id and paper.is_preprint:
         return f"arXiv:{tex_escape(paper.arxiv_id)}"
 
-    venue = JOURNAL_MACROS.get(paper.pub, tex_escape(paper.pub)) if paper.pub else ""
+    venue = JOURNAL_MACROS.get(paper.venue, tex_escape(paper.venue)) if paper.venue else ""
     parts = [venue] if venue else []
     if paper.volume:
         parts.append(tex_escape(paper.volume))
@@ -130,10 +114,10 @@ def format_citation_line(paper: AdsPaper) -> str:
 
 def render_item(paper: AdsPaper, nth_mode: bool = False) -> list[str]:
     if nth_mode:
-        first_author = format_author(paper.authors[0]) if paper.authors else "Unknown"
+        first_author = format_author(paper.authors[0], paper.own_author_index == 0) if paper.authors else "Unknown"
         citation = rf"\item {first_author}, et. al., ({paper.year}), {format_citation_line(paper)} \\"
     else:
-        citation = rf"\item {format_author_list(paper.authors)}, ({paper.year}), {format_citation_line(paper)} \\"
+        citation = rf"\item {format_author_list(paper.authors, paper.own_author_index)}, ({paper.year}), {format_citation_line(paper)} \\"
     return [
         citation,
         rf"\textbf{{Title:}} {tex_escape(paper.title)}",
@@ -200,9 +184,28 @@ def render_document(
     )
 
 
-def write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+def write_text(path: Path, text: str) -> bool:
+    return write_if_changed(path, text)
+
+
+def generate(
+    papers: list[AdsPaper],
+    out: Path,
+    name: str = DEFAULT_NAME,
+    highlight_count: int = DEFAULT_HIGHLIGHTS,
+    nth_threshold: int = 12,
+) -> dict[str, int]:
+    """Write the publication list TeX; return per-section counts and whether it changed."""
+    refereed, preprints, nth = split_papers(papers, nth_threshold)
+    highlights = sort_highlights(refereed)[: max(0, highlight_count)]
+    changed = write_text(out, render_document(name, highlights, refereed, preprints, nth))
+    return {
+        "highlights": len(highlights),
+        "refereed": len(refereed),
+        "preprints": len(preprints),
+        "nth_author": len(nth),
+        "changed": int(changed),
+    }
 
 
 def main() -> int:
@@ -218,17 +221,19 @@ def main() -> int:
     if not ads_json_path.exists():
         raise SystemExit(f"Missing ADS data file: {ads_json_path}. Run python scripts/sync_ads_data.py first.")
 
-    papers = read_papers_json(ads_json_path)
-    refereed, preprints, nth = split_papers(papers, args.nth_threshold)
-    highlights = sort_highlights(refereed)[: max(0, args.highlights)]
-    tex = render_document(args.name, highlights, refereed, preprints, nth)
-    write_text(Path(args.out), tex)
+    counts = generate(
+        read_papers_json(ads_json_path),
+        Path(args.out),
+        args.name,
+        args.highlights,
+        args.nth_threshold,
+    )
 
-    print(f"Wrote {args.out}")
+    print(f"{'Wrote' if counts['changed'] else 'No changes in'} {args.out}")
     print(
         "Counts: "
-        f"highlights={len(highlights)}, refereed={len(refereed)}, "
-        f"preprints={len(preprints)}, nth_author={len(nth)}"
+        f"highlights={counts['highlights']}, refereed={counts['refereed']}, "
+        f"preprints={counts['preprints']}, nth_author={counts['nth_author']}"
     )
     return 0
 
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Content-addressed cache of LLM topic classifications.
+
+Entries are keyed by a hash of (title, abstract, topic list, model), so a paper
+is only sent to the model again when one of those inputs changes.
+
+Usage:
+  python scripts/topic_cache.py --stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+from outputs import write_json_if_changed
+
+DEFAULT_CACHE_JSON = "data/topic_cache.json"
+
+
+def classification_key(title: str, abstract: str, topics: list[str], model: str) -> str:
+    normalized = json.dumps(
+        [" ".join(title.split()), " ".join(abstract.split()), list(topics), model],
+        ensure_ascii=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class TopicCache:
+    def __init__(self, path: Path, entries: dict[str, dict] | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, dict] = entries or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "TopicCache":
+        entries: dict[str, dict] = {}
+        if path.exists():
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            raw = payload.get("entries") or {}
+            entries = {str(key): value for key, value in raw.items() if isinstance(value, dict)}
+        return cls(path, entries)
+
+    def get(self, key: str) -> tuple[list[str], float | None] | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        confidence = entry.get("confidence")
+        return list(entry.get("topics") or []), (float(confidence) if confidence is not None else None)
+
+    def put(self, key: str, topics: list[str], confidence: float | None, model: str) -> None:
+        entry = {"topics": list(topics), "confidence": confidence, "model": model}
+        if self.entries.get(key) != entry:
+            self.entries[key] = entry
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty and self.path.exists():
+            return
+        payload = {
+            "schema_version": 1,
+            "entries": {key: self.entries[key] for key in sorted(self.entries)},
+        }
+        write_json_if_changed(self.path, payload)
+        self.dirty = False
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cache", default=DEFAULT_CACHE_JSON)
+    parser.add_argument("--stats", action="store_true", help="Print entry counts.")
+    args = parser.parse_args()
+
+    cache = TopicCache.load(Path(args.cache))
+    models: dict[str, int] = {}
+    for entry in cache.entries.values():
+        model = str(entry.get("model") or "unknown")
+        models[model] = models.get(model, 0) + 1
+    by_model = ", ".join(f"{model}={count}" for model, count in sorted(models.items()))
+    print(f"Entries: {len(cache.entries)}" + (f" ({by_model})" if by_model else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
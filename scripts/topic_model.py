@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Offline naive Bayes topic classifier trained on stored paper labels.
+
+The model is one binary multinomial naive Bayes per topic over title and
+abstract tokens, in pure Python so it runs anywhere the sync does. It is meant
+to pre-screen papers when opted in: confident predictions are used directly
+and ambiguous papers are left for the LLM.
+
+Usage:
+  python scripts/topic_model.py --evaluate
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import re
+from collections import Counter
+from pathlib import Path
+
+from ads_data import AdsPaper, read_papers_json
+
+DEFAULT_ADS_JSON = "data/ads_publications.json"
+# Leave-one-out on the stored labels (75 papers, topic list 56b28aa0a1fdaaf7) at 0.95:
+# confident on 33/75 (44%), exact match on 0.85 of those. That is about one wrong label
+# set in seven, so the sync only uses the model when asked (--local-classifier).
+DEFAULT_THRESHOLD = 0.95
+MIN_POSITIVE_EXAMPLES = 3
+TRAINING_SOURCES = {"llm", "manual_override"}
+
+TAG_RE = re.compile(r"<[^>]+>")
+TOKEN_RE = re.compile(r"[a-z][a-z0-9\-]{2,}")
+STOPWORDS = {
+    "the", "and", "for", "with", "that", "this", "from", "are", "which", "these", "our", "can", "has",
+    "have", "its", "their", "such", "than", "also", "using", "use", "used", "show", "find", "been",
+    "into", "both", "between", "over", "under", "within", "when", "where", "while", "there", "they",
+    "not", "but", "all", "any", "more", "most", "other", "some", "only", "well", "was", "were", "will",
+    "may", "each", "how", "new", "two", "one", "paper", "work", "results", "present", "study",
+}
+
+
+def tokenize(text: str) -> list[str]:
+    cleaned = TAG_RE.sub(" ", text).lower()
+    return [token for token in TOKEN_RE.findall(cleaned) if token not in STOPWORDS]
+
+
+def _stem(token: str) -> str:
+    return token[:-1] if token.endswith("s") and len(token) > 4 else token
+
+
+def paper_tokens(title: str, abstract: str | None) -> list[str]:
+    # Titles are short but dense in topic words, so count them twice.
+    return tokenize(title) * 2 + tokenize(abstract or "")
+
+
+class TopicModel:
+    def __init__(
+        self,
+        topics: list[str],
+        positive: dict[str, Counter],
+        negative: dict[str, Counter],
+        doc_counts: dict[str, tuple[int, int]],
+        vocabulary: set[str],
+    ) -> None:
+        self.topics = topics
+        self.positive = positive
+        self.negative = negative
+        self.doc_counts = doc_counts
+        self.vocabulary = vocabulary
+        self._totals = {
+            topic: (sum(positive[topic].values()), sum(negative[topic].values())) for topic in topics
+        }
+
+    @classmethod
+    def train(cls, examples: list[tuple[list[str], list[str]]], topics: list[str]) -> "TopicModel":
+        """Fit on ``(tokens, labels)`` pairs; labels outside ``topics`` are ignored."""
+        positive = {topic: Counter() for topic in topics}
+        negative = {topic: Counter() for topic in topics}
+        doc_counts: dict[str, tuple[int, int]] = {}
+        vocabulary: set[str] = set()
+        for tokens, _ in examples:
+            vocabulary.update(tokens)
+        for topic in topics:
+            n_pos = n_neg = 0
+            for tokens, labels in examples:
+                if topic in labels:
+                    positive[topic].update(tokens)
+                    n_pos += 1
+                else:
+                    negative[topic].update(tokens)
+                    n_neg += 1
+            doc_counts[topic] = (n_pos, n_neg)
+        return cls(topics, positive, negative, doc_counts, vocabulary)
+
+    @classmethod
+    def from_papers(cls, papers: list[AdsPaper], topics: list[str]) -> "TopicModel":
+        examples = [
+            (paper_tokens(paper.title, paper.load_abstract()), list(paper.topics))
+            for paper in papers
+            if paper.topic_source in TRAINING_SOURCES and paper.has_abstract
+        ]
+        return cls.train(examples, topics)
+
+    def trainable(self, topic: str) -> bool:
+        n_pos, n_neg = self.doc_counts.get(topic, (0, 0))
+        return n_pos >= MIN_POSITIVE_EXAMPLES and n_neg >= MIN_POSITIVE_EXAMPLES
+
+    def probabilities(self, tokens: list[str]) -> dict[str, float]:
+        """Return P(topic | tokens) for each trainable topic.
+
+        Token log-likelihood ratios are averaged rather than summed, which keeps
+        naive Bayes from saturating to 0/1 on long abstracts.
+        """
+        known = [token for token in tokens if token in self.vocabulary]
+        vocab_size = len(self.vocabulary)
+        out: dict[str, float] = {}
+        for topic in self.topics:
+            if not self.trainable(topic):
+                continue
+            n_pos, n_neg = self.doc_counts[topic]
+            total_pos, total_neg = self._totals[topic]
+            pos, neg = self.positive[topic], self.negative[topic]
+            ratio = 0.0
+            for token in known:
+                ratio += math.log((pos[token] + 1) / (total_pos + vocab_size))
+                ratio -= math.log((neg[token] + 1) / (total_neg + vocab_size))
+            if known:
+                ratio = ratio / math.sqrt(len(known))
+            log_odds = math.log(n_pos / n_neg) + ratio
+            out[topic] = 1.0 / (1.0 + math.exp(-max(-50.0, min(50.0, log_odds))))
+        return out
+
+    def predict(self, title: str, abstract: str | None) -> tuple[list[str], float]:
+        """Return predicted topics and a confidence in [0, 1].
+
+        Confidence is the weakest per-topic decision (``max(p, 1 - p)``). Topics
+        with too few training examples are only ruled out when the text never
+        mentions them; otherwise the paper is ambiguous (confidence 0).
+        """
+        tokens = paper_tokens(title, abstract)
+        probs = self.probabilities(tokens)
+        stems = {_stem(token) for token in tokens}
+        for topic in self.topics:
+            if topic in probs:
+                continue
+            if any(_stem(word) in stems for word in tokenize(topic)):
+                return [], 0.0
+        topics = [topic for topic in self.topics if probs.get(topic, 0.0) >= 0.5]
+        confidence = min((max(p, 1.0 - p) for p in probs.values()), default=0.0)
+        return topics, confidence
+
+
+def evaluate(papers: list[AdsPaper], topics: list[str], threshold: float) -> dict[str, float]:
+    """Leave-one-out accuracy of confident predictions on the labelled papers."""
+    labelled = [paper for paper in papers if paper.topic_source in TRAINING_SOURCES and paper.has_abstract]
+    confident = exact = 0
+    for i, held_out in enumerate(labelled):
+        model = TopicModel.from_papers(labelled[:i] + labelled[i + 1 :], topics)
+        predicted, confidence = model.predict(held_out.title, held_out.load_abstract())
+        if confidence < threshold:
+            continue
+        confident += 1
+        if set(predicted) == set(held_out.topics) & set(topics):
+            exact += 1
+    return {
+        "labelled": len(labelled),
+        "confident": confident,
+        "coverage": confident / len(labelled) if labelled else 0.0,
+        "exact_match": exact / confident if confident else 0.0,
+    }
+
+
+def main() -> int:
+    from sync_ads_data import load_topics
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ads-json", default=DEFAULT_ADS_JSON)
+    parser.add_argument("--topics-file", default="data/topics.json")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--evaluate", action="store_true", help="Report leave-one-out accuracy.")
+    args = parser.parse_args()
+
+    papers = read_papers_json(Path(args.ads_json))
+    topics = load_topics(Path(args.topics_file))
+    model = TopicModel.from_papers(papers, topics)
+    untrainable = [topic for topic in topics if not model.trainable(topic)]
+    print(f"Trained on {sum(n for n, _ in model.doc_counts.values())} labels; vocabulary={len(model.vocabulary)}")
+    if untrainable:
+        print(f"Too few examples (papers defer to the LLM): {', '.join(untrainable)}")
+    if args.evaluate:
+        stats = evaluate(papers, topics, args.threshold)
+        print(
+            f"Leave-one-out: confident={stats['confident']}/{stats['labelled']} "
+            f"(coverage={stats['coverage']:.2f}), exact_match={stats['exact_match']:.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+"""Lightweight tracing spans for the sync scripts.
+
+Spans record wall time per thread plus free-form attributes (host, status,
+bytes, retry, ...). A run can be exported as a Chrome trace (load it in
+chrome://tracing or https://ui.perfetto.dev) and summarized as a Markdown table,
+e.g. appended to ``$GITHUB_STEP_SUMMARY``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread: int
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans = []
+            self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, category: str = "stage", **attrs: Any) -> Iterator[dict[str, Any]]:
+        """Time the enclosed block; the yielded dict can be updated with attributes.
+
+        A ``retry`` attribute is inherited from the enclosing span on the same
+        thread, so HTTP spans inside a retry loop carry the attempt number.
+        """
+        stack: list[dict[str, Any]] = self._local.__dict__.setdefault("stack", [])
+        if "retry" not in attrs and stack and "retry" in stack[-1]:
+            attrs["retry"] = stack[-1]["retry"]
+        stack.append(attrs)
+        start = time.perf_counter()
+        try:
+            yield attrs
+        except BaseException as exc:
+            attrs.setdefault("error", type(exc).__name__)
+            raise
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            with self._lock:
+                self.spans.append(
+                    Span(name, category, start - self._origin, end - start, threading.get_ident(), attrs)
+                )
+
+    def chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        threads = {ident: index for index, ident in enumerate(dict.fromkeys(s.thread for s in spans))}
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": s.name,
+                    "cat": s.category,
+                    "ph": "X",
+                    "ts": round(s.start * 1e6, 1),
+                    "dur": round(s.duration * 1e6, 1),
+                    "pid": pid,
+                    "tid": threads[s.thread],
+                    "args": s.attrs,
+                }
+                for s in spans
+            ],
+        }
+
+    def write_chrome_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace(), default=str) + "\n", encoding="utf-8")
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Aggregate spans by category and name (``METHOD host/path`` for HTTP calls)."""
+        rows: dict[tuple[str, str], dict[str, Any]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for s in spans:
+            key = (s.category, s.name)
+            row = rows.setdefault(
+                key,
+                {"category": key[0], "name": key[1], "calls": 0, "seconds": 0.0, "max_seconds": 0.0,
+                 "bytes": 0, "errors": 0, "retries": 0},
+            )
+            row["calls"] += 1
+            row["seconds"] += s.duration
+            row["max_seconds"] = max(row["max_seconds"], s.duration)
+            row["bytes"] += int(s.attrs.get("bytes") or 0)
+            row["errors"] += 1 if s.attrs.get("error") else 0
+            row["retries"] += 1 if s.attrs.get("retry") else 0
+        return sorted(rows.values(), key=lambda row: (row["category"], -row["seconds"]))
+
+    def summary_markdown(self, title: str = "Sync timing") -> str:
+        lines = [
+            f"#### {title}",
+            "",
+            "| Kind | Span | Calls | Total (s) | Max (s) | Bytes | Errors | Retries |",
+            "| --- | --- | ---: | ---: | ---: | ---: | ---: | ---: |",
+        ]
+        for row in self.summary():
+            lines.append(
+                f"| {row['category']} | {row['name']} | {row['calls']} | {row['seconds']:.2f} | "
+                f"{row['max_seconds']:.2f} | {row['bytes']} | {row['errors']} | {row['retries']} |"
+            )
+        return "\n".join(lines) + "\n"
+
+
+TRACER = Tracer()
+span = TRACER.span
+
+
+def export_trace(trace_out: str | None, summary_out: str | None, title: str = "Sync timing") -> None:
+    """Write the Chrome trace and/or append the Markdown summary, if paths are given."""
+    if trace_out:
+        TRACER.write_chrome_trace(Path(trace_out))
+    if summary_out:
+        with Path(summary_out).open("a", encoding="utf-8") as handle:
+            handle.write("\n" + TRACER.summary_markdown(title))